@@ -0,0 +1,125 @@
+# bench_fade.py
+#
+# measures the cost of the stop fade when many widgets stop at the same time:
+# cpu time spent on the gui thread during the fade and the longest stall of
+# the event loop (a frame that took too long), comparing the old
+# stylesheet-based overlay, the painted overlay and the in-page fade
+# (fade_mode='page', no overlay widget).
+#
+# usage:
+#     QT_QPA_PLATFORM=offscreen python benchmarks/bench_fade.py
+#     python benchmarks/bench_fade.py --count 30 --backend web
+
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+
+def _use_stylesheet_overlay(nsw):
+    """restores the previous overlay behaviour: a stylesheet rebuilt on every animation tick."""
+    from PyQt6.QtCore import Qt, pyqtProperty
+    from PyQt6.QtGui import QColor
+    from PyQt6.QtWidgets import QWidget
+
+    def set_background_color(self, color):
+        if self._background_color != color:
+            self._background_color = color
+            self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+            self.setStyleSheet(f"background-color: {color.name(QColor.NameFormat.HexArgb)};")
+            self.update()
+
+    def paint_event(self, event):
+        QWidget.paintEvent(self, event)
+
+    nsw.OverlayWidget.setBackgroundColor = set_background_color
+    nsw.OverlayWidget.color = pyqtProperty(QColor, fget=nsw.OverlayWidget.backgroundColor, fset=set_background_color)
+    nsw.OverlayWidget.paintEvent = paint_event
+
+
+def run_mode(mode, count, backend, repeats):
+    """runs inside the child interpreter."""
+    import pyqt_no_signal_widget.no_signal_widget as nsw
+    from PyQt6.QtWidgets import QApplication, QWidget, QGridLayout
+    from PyQt6.QtCore import QEventLoop, QTimer, QElapsedTimer
+
+    if mode == "stylesheet":
+        _use_stylesheet_overlay(nsw)
+
+    app = QApplication(sys.argv)
+    host = QWidget()
+    grid = QGridLayout(host)
+    host.resize(1600, 900)
+    fade_mode = nsw.FADE_PAGE if mode == "page" else nsw.FADE_OVERLAY
+    widgets = [nsw.NoSignalWidget(initial_text=f"FEED {i + 1}", backend=backend, fade_mode=fade_mode)
+               for i in range(count)]
+    for index, widget in enumerate(widgets):
+        grid.addWidget(widget, index // 6, index % 6)
+    host.show()
+
+    def run_for(ms, probe=None):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        if probe is not None:
+            probe.start()
+        loop.exec()
+        if probe is not None:
+            probe.stop()
+
+    run_for(3000) # let everything load
+
+    fades = []
+    for _ in range(repeats):
+        for action in ("stop", "start"):
+            gaps = []
+            clock = QElapsedTimer()
+            probe = QTimer()
+            probe.setInterval(1)
+
+            def on_probe():
+                if clock.isValid():
+                    gaps.append(clock.restart())
+                else:
+                    clock.start()
+            probe.timeout.connect(on_probe)
+
+            cpu_started = time.process_time()
+            for widget in widgets:
+                getattr(widget, action)()
+            run_for(650, probe) # 500 ms fade plus the delayed overlay hide
+            cpu_ms = (time.process_time() - cpu_started) * 1000.0
+            fades.append({"action": action, "cpu_ms": cpu_ms, "cpu_ms_per_widget": cpu_ms / count,
+                          "max_stall_ms": max(gaps or [0]), "mean_gap_ms": sum(gaps) / max(len(gaps), 1)})
+
+    print(json.dumps({"mode": mode, "count": count, "backend": widgets[0].backend, "fades": fades}))
+    app.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fade cost with many widgets stopping at once")
+    parser.add_argument("--count", type=int, default=30)
+    parser.add_argument("--backend", default="auto", choices=["auto", "web", "native"])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--mode", choices=["stylesheet", "painted", "page"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.count, args.backend, args.repeats)
+        return
+
+    print(f"{'fade':>11} {'action':>6} {'cpu ms/fade/widget':>19} {'max stall ms':>13}")
+    for mode in ("stylesheet", "painted", "page"):
+        output = subprocess.run([sys.executable, __file__, "--mode", mode, "--count", str(args.count),
+                                 "--backend", args.backend, "--repeats", str(args.repeats)],
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        for action in ("stop", "start"):
+            runs = [fade for fade in result["fades"] if fade["action"] == action]
+            cpu = sum(fade["cpu_ms_per_widget"] for fade in runs) / len(runs)
+            stall = max(fade["max_stall_ms"] for fade in runs)
+            print(f"{mode:>11} {action:>6} {cpu:>19.2f} {stall:>13}")
+
+
+if __name__ == "__main__":
+    main()
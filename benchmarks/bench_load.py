@@ -0,0 +1,84 @@
+# bench_load.py
+#
+# measures the time from NoSignalWidget construction to loadFinished, for the
+# per-instance setHtml page (before) and the static page served from the
+# custom scheme (after).
+#
+# usage:
+#     python benchmarks/bench_load.py
+#     python benchmarks/bench_load.py --count 32
+#
+# each mode runs in a fresh interpreter so both pay the same engine start-up;
+# the first widget (cold start) is reported separately.
+
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+
+def run_mode(mode, count):
+    """runs inside the child interpreter: creates widgets one by one and times each load."""
+    import pyqt_no_signal_widget.no_signal_widget as nsw
+    from pyqt_no_signal_widget import configure_engine
+    from PyQt6.QtWidgets import QApplication, QWidget, QGridLayout
+    from PyQt6.QtCore import QEventLoop, QTimer
+
+    if mode == "scheme":
+        configure_engine() # registers the scheme before the app exists
+    else:
+        nsw.is_scheme_registered = lambda: False
+
+    app = QApplication(sys.argv)
+    if mode == "scheme" and not nsw.is_scheme_registered():
+        sys.exit("error: the nosignal:// scheme could not be registered; 'scheme' would measure setHtml.")
+    host = QWidget()
+    grid = QGridLayout(host)
+    host.resize(1600, 900)
+    host.show()
+
+    timings_ms = []
+    widgets = []
+    for index in range(count):
+        loop = QEventLoop()
+        started = time.perf_counter()
+        widget = nsw.NoSignalWidget(initial_text=f"FEED {index + 1}", backend="web")
+        widget.loadFinished.connect(loop.quit)
+        widget.loadFailed.connect(loop.quit)
+        QTimer.singleShot(10000, loop.quit) # give up on a stuck load
+        grid.addWidget(widget, index // 8, index % 8)
+        widgets.append(widget)
+        loop.exec()
+        timings_ms.append((time.perf_counter() - started) * 1000.0)
+
+    warm = timings_ms[1:] or timings_ms
+    print(json.dumps({"mode": mode, "first_ms": timings_ms[0], "median_ms": statistics.median(warm),
+                      "mean_ms": statistics.fmean(warm), "timings_ms": timings_ms}))
+    app.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="per-instance load time, sethtml vs static scheme page")
+    parser.add_argument("--count", type=int, default=16)
+    parser.add_argument("--mode", choices=["sethtml", "scheme"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.count)
+        return
+
+    results = {}
+    for mode in ("sethtml", "scheme"):
+        output = subprocess.run([sys.executable, __file__, "--mode", mode, "--count", str(args.count)],
+                                capture_output=True, text=True, check=True).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'mode':>8} {'first (ms)':>11} {'median (ms)':>12} {'mean (ms)':>10}")
+    for mode, result in results.items():
+        print(f"{mode:>8} {result['first_ms']:>11.1f} {result['median_ms']:>12.1f} {result['mean_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
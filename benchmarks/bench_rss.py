@@ -0,0 +1,116 @@
+# bench_rss.py
+#
+# measures the resident memory (main process + qtwebengine helper processes)
+# added by each NoSignalWidget, with and without the shared engine configuration.
+#
+# usage (linux, reads /proc):
+#     python benchmarks/bench_rss.py                # runs both modes and compares
+#     python benchmarks/bench_rss.py --counts 1 8 32
+#
+# each mode runs in a fresh interpreter because chromium switches can only be
+# applied before the web engine starts.
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+
+def process_tree_rss_kb(root_pid):
+    """sums VmRSS of root_pid and all of its descendants."""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # the command name may contain spaces; ppid follows the closing paren
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total
+
+
+def run_mode(mode, counts):
+    """runs inside the child interpreter: builds widgets and samples rss after each batch."""
+    if mode == "shared":
+        from pyqt_no_signal_widget import configure_engine
+        configure_engine(process_per_site=True, renderer_process_limit=2, disable_gpu_rasterization=True)
+
+    from PyQt6.QtWidgets import QApplication, QWidget, QGridLayout
+    from PyQt6.QtCore import QEventLoop, QTimer
+    import pyqt_no_signal_widget.no_signal_widget as nsw
+
+    if mode == "default":
+        # reproduce the previous behaviour: every page on the default profile, no switches
+        from PyQt6.QtWebEngineCore import QWebEngineProfile
+        nsw.shared_profile = QWebEngineProfile.defaultProfile
+
+    app = QApplication(sys.argv)
+    host = QWidget()
+    grid = QGridLayout(host)
+    host.resize(1600, 900)
+    host.show()
+
+    def settle(ms):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+
+    settle(500)
+    baseline = process_tree_rss_kb(os.getpid())
+    widgets = []
+    samples = []
+    for count in counts:
+        while len(widgets) < count:
+            widget = nsw.NoSignalWidget(initial_text=f"FEED {len(widgets) + 1}", backend="web")
+            grid.addWidget(widget, len(widgets) // 8, len(widgets) % 8)
+            widgets.append(widget)
+        settle(3000) # let pages load and renderers spawn
+        rss = process_tree_rss_kb(os.getpid())
+        samples.append({"widgets": count, "rss_kb": rss, "per_widget_kb": (rss - baseline) / count})
+    print(json.dumps({"mode": mode, "baseline_kb": baseline, "samples": samples}))
+    app.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="rss per NoSignalWidget, default vs shared engine configuration")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--mode", choices=["default", "shared"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.counts)
+        return
+
+    results = {}
+    for mode in ("default", "shared"):
+        env = dict(os.environ)
+        env.pop("QTWEBENGINE_CHROMIUM_FLAGS", None)
+        output = subprocess.run([sys.executable, __file__, "--mode", mode, "--counts", *map(str, args.counts)],
+                                env=env, capture_output=True, text=True, check=True).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'widgets':>8} {'default MB/widget':>18} {'shared MB/widget':>17}")
+    for before, after in zip(results["default"]["samples"], results["shared"]["samples"]):
+        print(f"{before['widgets']:>8} {before['per_widget_kb'] / 1024:>18.1f} {after['per_widget_kb'] / 1024:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
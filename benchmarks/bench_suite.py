@@ -0,0 +1,254 @@
+# bench_suite.py
+#
+# headless benchmark suite: import time, construction and load time, rss per
+# instance, setText/setColors throughput and start/stop fade frame times,
+# written as one json document so results can be compared between releases.
+#
+# usage (linux, reads /proc for rss):
+#     QT_QPA_PLATFORM=offscreen python benchmarks/bench_suite.py --output results.json
+#     python benchmarks/bench_suite.py --cases load throughput --backend native
+#
+# every case runs in a fresh interpreter so one case's engine state (chromium
+# processes, caches) doesn't leak into the next.
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_rss import process_tree_rss_kb
+
+CASES = ("import", "load", "rss", "throughput", "fade")
+
+
+def _summary(values):
+    """median, mean, p95 and max of a list of timings."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return {"median": statistics.median(ordered), "mean": statistics.fmean(ordered),
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], "max": ordered[-1], "n": len(ordered)}
+
+
+def _make_app():
+    from PyQt6.QtWidgets import QApplication, QWidget, QGridLayout
+    app = QApplication(sys.argv)
+    host = QWidget()
+    grid = QGridLayout(host)
+    host.resize(1600, 900)
+    host.show()
+    return app, host, grid
+
+
+def _run_for(ms, probe=None):
+    """spins the event loop for ms milliseconds (with an optional probe timer running)."""
+    from PyQt6.QtCore import QEventLoop, QTimer
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    if probe is not None:
+        probe.start()
+    loop.exec()
+    if probe is not None:
+        probe.stop()
+
+
+def _wait_loaded(widget, timeout_ms=10000):
+    """spins the event loop until widget has loaded (or timeout_ms passed)."""
+    from PyQt6.QtCore import QEventLoop, QTimer
+    if widget.isLoaded():
+        return
+    loop = QEventLoop()
+    widget.loadFinished.connect(loop.quit)
+    widget.loadFailed.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit) # give up on a stuck load
+    loop.exec()
+
+
+# --- cases (each runs inside its own child interpreter) ---
+def case_import(args):
+    started = time.perf_counter()
+    import PyQt6.QtWidgets # noqa: F401 -- qt itself, reported separately
+    qt_ms = (time.perf_counter() - started) * 1000.0
+    started = time.perf_counter()
+    import pyqt_no_signal_widget # noqa: F401
+    return {"pyqt_ms": qt_ms, "package_ms": (time.perf_counter() - started) * 1000.0}
+
+
+def case_load(args):
+    from pyqt_no_signal_widget import NoSignalWidget
+    app, host, grid = _make_app()
+    construct_ms, load_ms = [], []
+    for index in range(args.load_count):
+        started = time.perf_counter()
+        widget = NoSignalWidget(initial_text=f"FEED {index + 1}", backend=args.backend, parent=host)
+        construct_ms.append((time.perf_counter() - started) * 1000.0)
+        grid.addWidget(widget, index // 8, index % 8)
+        _wait_loaded(widget)
+        load_ms.append((time.perf_counter() - started) * 1000.0)
+    return {"count": args.load_count, "backend": widget.backend, "first_load_ms": load_ms[0],
+            "construct_ms": _summary(construct_ms), "load_ms": _summary(load_ms[1:] or load_ms)}
+
+
+def case_rss(args):
+    from pyqt_no_signal_widget import NoSignalWidget
+    app, host, grid = _make_app()
+    _run_for(500)
+    baseline = process_tree_rss_kb(os.getpid())
+    widgets, samples = [], []
+    for count in args.counts:
+        while len(widgets) < count:
+            widget = NoSignalWidget(initial_text=f"FEED {len(widgets) + 1}", backend=args.backend, parent=host)
+            grid.addWidget(widget, len(widgets) // 8, len(widgets) % 8)
+            widgets.append(widget)
+        for widget in widgets:
+            _wait_loaded(widget)
+        _run_for(1000) # let renderers settle
+        rss = process_tree_rss_kb(os.getpid())
+        samples.append({"widgets": count, "rss_kb": rss, "per_widget_kb": (rss - baseline) / count})
+    return {"backend": widgets[0].backend if widgets else args.backend, "baseline_kb": baseline, "samples": samples}
+
+
+def case_throughput(args):
+    from PyQt6.QtCore import QCoreApplication
+    from pyqt_no_signal_widget import NoSignalWidget
+    app, host, grid = _make_app()
+    widget = NoSignalWidget(backend=args.backend, parent=host)
+    grid.addWidget(widget, 0, 0)
+    _wait_loaded(widget)
+    palettes = [{"--red": "bright_green", "--text-color": "gold"}, {"--red": "orange", "--text-color": "white"}]
+    calls = {
+        "setText": lambda i: widget.setText(f"FEED {i}"),
+        "setColors": lambda i: widget.setColors(palettes[i % 2]),
+    }
+    results = {}
+    for name, call in calls.items():
+        started = time.perf_counter()
+        for i in range(args.calls):
+            call(i)
+            if i % 100 == 99:
+                QCoreApplication.processEvents() # let the coalesced flushes go out
+        QCoreApplication.processEvents()
+        elapsed = time.perf_counter() - started
+        results[name] = {"calls": args.calls, "seconds": elapsed, "calls_per_second": args.calls / elapsed}
+    results["backend"] = widget.backend
+    results["flushed_scripts"] = widget.metrics()["flushed_scripts"]
+    return results
+
+
+def case_fade(args):
+    from PyQt6.QtCore import QTimer, QElapsedTimer
+    from pyqt_no_signal_widget import NoSignalWidget
+    app, host, grid = _make_app()
+    widgets = [NoSignalWidget(initial_text=f"FEED {i + 1}", backend=args.backend, parent=host)
+               for i in range(args.fade_count)]
+    for index, widget in enumerate(widgets):
+        grid.addWidget(widget, index // 6, index % 6)
+    for widget in widgets:
+        _wait_loaded(widget)
+    _run_for(500)
+
+    # event-loop gaps seen by a 1 ms probe timer while all widgets fade at once
+    runs = {"stop": ([], []), "start": ([], [])} # action -> (gaps, cpu per widget)
+    for _ in range(args.repeats):
+        for action in ("stop", "start"):
+            gaps, cpu = runs[action]
+            clock = QElapsedTimer()
+            probe = QTimer()
+            probe.setInterval(1)
+
+            def on_probe():
+                if clock.isValid():
+                    gaps.append(clock.restart())
+                else:
+                    clock.start()
+            probe.timeout.connect(on_probe)
+            cpu_started = time.process_time()
+            for widget in widgets:
+                getattr(widget, action)()
+            _run_for(650, probe) # the 500 ms fade plus the delayed overlay hide
+            cpu.append((time.process_time() - cpu_started) * 1000.0 / len(widgets))
+
+    results = {action: {"frame_gap_ms": _summary(gaps), "cpu_ms_per_widget": _summary(cpu)}
+               for action, (gaps, cpu) in runs.items()}
+    results["count"] = len(widgets)
+    results["backend"] = widgets[0].backend
+    return results
+
+
+# --- driver ---
+def _meta(args):
+    from PyQt6.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+    try:
+        from importlib.metadata import version
+        package_version = version("pyqt-no-signal-widget")
+    except Exception:
+        package_version = None
+    return {"package_version": package_version, "python": platform.python_version(),
+            "qt": QT_VERSION_STR, "pyqt": PYQT_VERSION_STR, "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM"), "backend": args.backend,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+
+
+def _child_args(args):
+    return ["--backend", args.backend, "--counts", *map(str, args.counts), "--load-count", str(args.load_count),
+            "--calls", str(args.calls), "--fade-count", str(args.fade_count), "--repeats", str(args.repeats)]
+
+
+def _run_case(case, args):
+    """runs one case in a fresh interpreter and returns its json result (or the error)."""
+    runs = args.import_runs if case == "import" else 1
+    results = []
+    for _ in range(runs):
+        process = subprocess.run([sys.executable, __file__, "--case", case, *_child_args(args)],
+                                 capture_output=True, text=True, timeout=args.timeout)
+        lines = process.stdout.strip().splitlines()
+        if process.returncode != 0 or not lines:
+            return {"error": process.stderr.strip().splitlines()[-1:] or f"exit code {process.returncode}"}
+        results.append(json.loads(lines[-1]))
+    if case == "import": # cold imports vary; keep the spread
+        return {key: _summary([result[key] for result in results]) for key in results[0]}
+    return results[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="headless NoSignalWidget benchmark suite (json output)")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--backend", default="auto", choices=["auto", "web", "native"])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 8, 32, 64], help="rss: widget counts")
+    parser.add_argument("--load-count", type=int, default=8, help="load: widgets created one by one")
+    parser.add_argument("--calls", type=int, default=5000, help="throughput: calls per method")
+    parser.add_argument("--fade-count", type=int, default=12, help="fade: widgets fading together")
+    parser.add_argument("--repeats", type=int, default=3, help="fade: runs per action")
+    parser.add_argument("--import-runs", type=int, default=5, help="import: cold interpreters")
+    parser.add_argument("--timeout", type=int, default=600, help="seconds per case")
+    parser.add_argument("--output", help="json file to write (default: stdout)")
+    parser.add_argument("--case", choices=CASES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        # the child: one case, one json line on stdout (the package logs go before it)
+        result = globals()["case_" + args.case](args)
+        print(json.dumps(result))
+        return
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    report = {"meta": _meta(args), "results": {}}
+    for case in args.cases:
+        print(f"running {case}...", file=sys.stderr)
+        report["results"][case] = _run_case(case, args)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,7 @@ from PyQt6.QtCore import Qt, QTimer
 # pip install -e .
 try:
     # Import directly from the package name defined in pyproject.toml
-    from pyqt_no_signal_widget import NoSignalWidget
+    from pyqt_no_signal_widget import NoSignalWidget, configure_engine
 except ImportError as e:
     # More specific error message
     QMessageBox.critical(None, "Import Error",
@@ -461,6 +461,7 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Could not set High DPI attributes: {e}")
 
+    configure_engine() # before the QApplication: one shared, cached page for every widget
     app = QApplication(sys.argv)
     example_window = NoSignalExampleWindow()
     example_window.show()
@@ -1,2 +1,12 @@
 from .no_signal_widget import NoSignalWidget
-__all__ = ["NoSignalWidget"] 
\ No newline at end of file
+from .engine import configure_engine, shared_profile
+from .budget import set_page_budget, page_counters
+from .dispatch import post_counters
+from .watchdog import SignalWatchdog
+from .pool import NoSignalWidgetPool
+from .wall import NoSignalWall
+from .native_view import bar_layer_cache
+from .snapshot import render_no_signal_image, image_to_png, snapshot_cache
+__all__ = ["NoSignalWidget", "NoSignalWidgetPool", "NoSignalWall", "configure_engine", "shared_profile", "bar_layer_cache",
+           "set_page_budget", "page_counters", "render_no_signal_image", "image_to_png", "snapshot_cache",
+           "post_counters", "SignalWatchdog"]
\ No newline at end of file
@@ -0,0 +1,69 @@
+# assets.py
+
+import base64
+from functools import lru_cache
+from importlib import resources
+
+FONT_FAMILY = "Michroma"
+FONT_FILE = "Michroma-Regular.ttf"
+
+
+@lru_cache(maxsize=None)
+def asset_bytes(name):
+    """returns the contents of a file in the package's assets directory, or none if it isn't bundled."""
+    try:
+        return resources.files(__package__).joinpath("assets", name).read_bytes()
+    except (FileNotFoundError, OSError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def font_bundled():
+    """true if the font file is present in the package's assets directory."""
+    bundled = asset_bytes(FONT_FILE) is not None
+    if not bundled:
+        print(f"info: {FONT_FILE} is not bundled; the text uses an installed {FONT_FAMILY} or sans-serif.")
+    return bundled
+
+
+@lru_cache(maxsize=None)
+def font_data_url():
+    """the bundled michroma font as a data: url, or none if the font file is missing."""
+    data = asset_bytes(FONT_FILE)
+    if data is None:
+        return None
+    return "data:font/ttf;base64," + base64.b64encode(data).decode("ascii")
+
+
+@lru_cache(maxsize=None)
+def font_face_css(font_url=None):
+    """
+    the @font-face rule for the message text.
+
+    the page never touches the network for it: an installed copy is tried
+    first, then the font file in the assets directory if present, either
+    from font_url (a url served by the scheme handler) or inlined as a data:
+    url. otherwise the text falls back to sans-serif immediately.
+    """
+    sources = [f'local("{FONT_FAMILY}")', f'local("{FONT_FAMILY}-Regular")']
+    if font_bundled():
+        sources.append(f'url("{font_url or font_data_url()}") format("truetype")')
+    return ('@font-face { font-family: "%s"; src: %s; font-weight: normal; font-style: normal; font-display: swap; }'
+            % (FONT_FAMILY, ", ".join(sources)))
+
+
+_native_font_registered = False
+
+
+def register_native_font():
+    """adds the bundled font to qt's font database (once) so the native backend can use it."""
+    global _native_font_registered
+    if _native_font_registered:
+        return
+    _native_font_registered = True
+    data = asset_bytes(FONT_FILE)
+    if data is None:
+        return
+    from PyQt6.QtGui import QFontDatabase
+    if QFontDatabase.addApplicationFontFromData(data) == -1:
+        print(f"warning: could not register the bundled {FONT_FILE} with qt.")
@@ -0,0 +1,111 @@
+# bridge.py
+
+from PyQt6.QtCore import QObject, QFile, QIODevice, pyqtSignal, pyqtSlot
+
+# name the bridge is published under on each page's web channel
+BRIDGE_NAME = "bridge"
+# qwebchannel.js as shipped inside the qtwebchannel library
+CHANNEL_SCRIPT_PATH = ":/qtwebchannel/qwebchannel.js"
+
+_channel_script_installed = None
+
+
+class PageBridge(QObject):
+    """
+    the python end of a page's qwebchannel.
+
+    python -> page: pushstate() sends one batched state update (the same dict
+    applystate() takes) as a single channel message. page -> python: the page
+    calls the slots below, which are re-emitted as qt signals.
+    """
+
+    # python -> page: a batch of state changes for applystate()
+    stateChanged = pyqtSignal("QVariantMap")
+
+    # page -> python notifications
+    connected = pyqtSignal() # the page has set up its end of the channel
+    stateApplied = pyqtSignal(int, bool) # batch sequence number, animation active
+    fadeFinished = pyqtSignal(bool) # the in-page fade ended; true if stopped
+    frameStatsReported = pyqtSignal(dict) # a finished frame-time sample
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._connected = False
+
+    def isConnected(self):
+        """true once the page has called ready()."""
+        return self._connected
+
+    def reset(self):
+        """forgets the connection (the page is being unloaded); ready() is expected again."""
+        self._connected = False
+
+    def pushState(self, state):
+        """sends a state batch to the page."""
+        self.stateChanged.emit(state)
+
+    # --- slots called from the page ---
+    @pyqtSlot()
+    def ready(self):
+        self._connected = True
+        self.connected.emit()
+
+    @pyqtSlot(int, bool)
+    def acknowledge(self, sequence, active):
+        self.stateApplied.emit(sequence, active)
+
+    @pyqtSlot(bool)
+    def reportFade(self, stopped):
+        self.fadeFinished.emit(stopped)
+
+    @pyqtSlot("QVariantMap")
+    def reportFrameStats(self, stats):
+        self.frameStatsReported.emit(dict(stats))
+
+
+def install_channel_script(profile):
+    """
+    injects qwebchannel.js into every page of the profile at document
+    creation, once for the profile instead of per page. returns true if the
+    script is available (the bridge can be used).
+    """
+    global _channel_script_installed
+    from PyQt6.QtWebEngineCore import QWebEngineScript
+
+    source = QFile(CHANNEL_SCRIPT_PATH)
+    if not source.open(QIODevice.OpenModeFlag.ReadOnly):
+        print(f"warning: {CHANNEL_SCRIPT_PATH} is not available; falling back to runJavaScript.")
+        _channel_script_installed = False
+        return False
+    script = QWebEngineScript()
+    script.setName("qwebchannel")
+    script.setSourceCode(bytes(source.readAll()).decode("utf-8"))
+    script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+    script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+    script.setRunsOnSubFrames(False)
+    profile.scripts().insert(script)
+    _channel_script_installed = True
+    return True
+
+
+def is_channel_available():
+    """true if qwebchannel.js was installed on the shared profile."""
+    return bool(_channel_script_installed)
+
+
+def attach_bridge(page):
+    """
+    creates a pagebridge and publishes it on a new web channel of page.
+    returns none if qtwebchannel or its script isn't available.
+    """
+    if not is_channel_available():
+        return None
+    try:
+        from PyQt6.QtWebChannel import QWebChannel
+    except ImportError:
+        return None
+    bridge = PageBridge(page)
+    channel = QWebChannel(page)
+    channel.registerObject(BRIDGE_NAME, bridge)
+    page.setWebChannel(channel)
+    return bridge
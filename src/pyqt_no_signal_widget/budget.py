@@ -0,0 +1,108 @@
+# budget.py
+
+import weakref
+from PyQt6 import sip
+from PyQt6.QtCore import QTimer
+
+# rough renderer memory of one page when pages share a renderer process (see
+# configure_engine); measure your own with benchmarks/bench_rss.py
+PAGE_MEMORY_MB = 30
+
+_widgets = weakref.WeakSet() # every nosignalwidget that has created a web page
+_max_pages = None
+_max_memory_mb = None
+_page_memory_mb = PAGE_MEMORY_MB
+_enforce_scheduled = False
+_counters = {"discards": 0, "restores": 0}
+
+
+def set_page_budget(max_pages=None, max_memory_mb=None, page_memory_mb=PAGE_MEMORY_MB):
+    """
+    limits the number of live web pages across all nosignalwidgets.
+
+    when the limit is exceeded, the widgets that have been hidden longest
+    have their page discarded (qwebenginepage.lifecyclestate.discarded) and
+    show a cached frame instead. a discarded page is reloaded and given its
+    text, colors and state again when its widget is shown. visible widgets
+    are never discarded, so the limit can be exceeded while they are all
+    on screen.
+
+    args:
+        max_pages (int, optional): maximum number of live pages. none: no limit.
+        max_memory_mb (float, optional): memory budget for all pages, converted
+            to a page count with page_memory_mb. none: no limit.
+        page_memory_mb (float): estimated memory of one page.
+    """
+    global _max_pages, _max_memory_mb, _page_memory_mb
+    _max_pages = max_pages
+    _max_memory_mb = max_memory_mb
+    _page_memory_mb = page_memory_mb
+    schedule_enforce()
+
+
+def page_limit():
+    """the effective maximum number of live pages, or none if unlimited."""
+    limits = []
+    if _max_pages is not None:
+        limits.append(max(0, int(_max_pages)))
+    if _max_memory_mb is not None:
+        limits.append(max(0, int(_max_memory_mb // max(_page_memory_mb, 1))))
+    return min(limits) if limits else None
+
+
+def page_counters():
+    """
+    counters for the page budget.
+
+    keys:
+        live: widgets whose page is currently loaded or loading.
+        discarded: widgets whose page is currently discarded.
+        discards: pages discarded so far.
+        restores: discarded pages brought back so far.
+        limit: the effective page limit (none: unlimited).
+    """
+    widgets = _alive_widgets()
+    return {"live": sum(1 for widget in widgets if widget.hasLivePage()),
+            "discarded": sum(1 for widget in widgets if widget.isDiscarded()),
+            **_counters, "limit": page_limit()}
+
+
+def register_page(widget):
+    """called by a widget once it has created its web page."""
+    _widgets.add(widget)
+    schedule_enforce()
+
+
+def count_page_event(event):
+    """counts a 'discards' or 'restores' event."""
+    _counters[event] += 1
+
+
+def schedule_enforce():
+    """checks the budget at the end of the current event-loop turn (once per turn)."""
+    global _enforce_scheduled
+    if page_limit() is None or _enforce_scheduled:
+        return
+    _enforce_scheduled = True
+    QTimer.singleShot(0, _enforce)
+
+
+def _alive_widgets():
+    return [widget for widget in list(_widgets) if not sip.isdeleted(widget)]
+
+
+def _enforce():
+    """discards the pages of the longest-hidden widgets until the budget is met."""
+    global _enforce_scheduled
+    _enforce_scheduled = False
+    limit = page_limit()
+    if limit is None:
+        return
+    live = [widget for widget in _alive_widgets() if widget.hasLivePage()]
+    excess = len(live) - limit
+    if excess <= 0:
+        return
+    hidden = sorted((widget for widget in live if widget.hiddenSince() is not None),
+                    key=lambda widget: widget.hiddenSince())
+    for widget in hidden[:excess]:
+        widget.discardPage()
@@ -0,0 +1,74 @@
+# colors.py
+
+import re
+from functools import lru_cache
+from PyQt6.QtGui import QColor
+
+# upper bound on memoized color strings; palettes are small, but free-form
+# input (e.g. a color picker) would otherwise grow the cache without limit
+COLOR_CACHE_SIZE = 512
+
+_CSS_FUNCTION_RE = re.compile(r"^\s*(rgba?|hsla?)\s*\(\s*([^)]*)\)\s*$", re.IGNORECASE)
+_CSS_HEX_ALPHA_RE = re.compile(r"^#([0-9a-f]{4}|[0-9a-f]{8})$", re.IGNORECASE)
+
+
+def _parse_channel(token, scale):
+    """parses a css channel value ('128', '50%', '0.5') into a float of the given scale."""
+    token = token.strip()
+    if token.endswith("%"):
+        return float(token[:-1]) * scale / 100.0
+    return float(token)
+
+
+def parse_css_color(value):
+    """
+    converts a css color string into a qcolor.
+
+    handles rgb()/rgba()/hsl()/hsla() functional notation, which qcolor does not
+    parse itself, and css #rgba/#rrggbbaa (qcolor reads 8 digits as #aarrggbb).
+    everything else (hex, svg names) is deferred to qcolor.
+    returns an invalid qcolor if the value can't be understood.
+    """
+    if not isinstance(value, str):
+        return QColor()
+    hex_match = _CSS_HEX_ALPHA_RE.match(value.strip())
+    if hex_match:
+        digits = hex_match.group(1)
+        if len(digits) == 4:
+            digits = "".join(digit * 2 for digit in digits)
+        return QColor.fromString(f"#{digits[6:]}{digits[:6]}")
+    match = _CSS_FUNCTION_RE.match(value)
+    if not match:
+        return QColor.fromString(value.strip())
+
+    function = match.group(1).lower()
+    parts = [p for p in re.split(r"[\s,/]+", match.group(2).strip()) if p]
+    if len(parts) not in (3, 4):
+        return QColor()
+    try:
+        alpha = _parse_channel(parts[3], 1.0) if len(parts) == 4 else 1.0
+        alpha = min(max(alpha, 0.0), 1.0)
+        if function.startswith("rgb"):
+            r, g, b = (min(max(_parse_channel(p, 255.0), 0.0), 255.0) for p in parts[:3])
+            return QColor.fromRgbF(r / 255.0, g / 255.0, b / 255.0, alpha)
+        hue = float(parts[0].rstrip("deg")) % 360.0
+        saturation = min(max(_parse_channel(parts[1], 1.0), 0.0), 1.0)
+        lightness = min(max(_parse_channel(parts[2], 1.0), 0.0), 1.0)
+        return QColor.fromHslF(hue / 360.0, saturation, lightness, alpha)
+    except ValueError:
+        return QColor()
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def normalize_css_color(value):
+    """
+    validates a css color string and returns it in the canonical
+    'rgba(r, g, b, a)' form used by default_colors, or none if it isn't a
+    color. results are memoized, so re-applying the same palette is a
+    dictionary lookup.
+    """
+    color = parse_css_color(value)
+    if not color.isValid():
+        return None
+    alpha = round(color.alphaF(), 3)
+    return f"rgba({color.red()}, {color.green()}, {color.blue()}, {alpha:g})"
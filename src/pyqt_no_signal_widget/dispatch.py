@@ -0,0 +1,112 @@
+# dispatch.py
+
+import threading
+from collections import deque
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, Qt, QCoreApplication, QTimer, QElapsedTimer, pyqtSignal
+from .textstream import frame_interval_ms
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+class PostDispatcher(QObject):
+    """
+    carries nosignalwidget.post() calls from any thread to the gui thread.
+
+    posting appends to a deque (atomic, no lock) and only the first post
+    after a drain emits the queued wake-up signal. drains are at least a
+    display frame apart, so any number of threads posting at any rate cost
+    at most one batch per frame. each drain coalesces everything queued per
+    widget (last text wins, colors are merged, last start/stop wins) before
+    applying it.
+    """
+
+    wake = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self._queue = deque() # (widget, update dict)
+        self._wake_lock = threading.Lock() # guards _wake_pending only
+        self._wake_pending = False
+        self.posted = 0
+        self.drains = 0
+        self.applied = 0
+        self._drain_clock = QElapsedTimer() # time since the last drain
+        self._drain_timer = QTimer(self) # delays a drain that would come too soon
+        self._drain_timer.setSingleShot(True)
+        self._drain_timer.timeout.connect(self._drain)
+        self.wake.connect(self._on_wake, Qt.ConnectionType.QueuedConnection)
+
+    def post(self, widget, update):
+        """queues update for widget; callable from any thread."""
+        self._queue.append((widget, update))
+        self.posted += 1 # approximate under contention; statistics only
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        self.wake.emit()
+
+    def _on_wake(self):
+        """drains now, or once a frame has passed since the previous drain."""
+        if self._drain_timer.isActive():
+            return
+        interval = frame_interval_ms()
+        if self._drain_clock.isValid() and self._drain_clock.elapsed() < interval:
+            self._drain_timer.start(interval - self._drain_clock.elapsed())
+        else:
+            self._drain()
+
+    def _drain(self):
+        """applies everything queued so far, one coalesced update per widget (gui thread)."""
+        with self._wake_lock:
+            self._wake_pending = False # posts from here on wake the next drain
+        self._drain_clock.start()
+        batch = {}
+        # only what is queued now: producers posting faster than this loop can't keep it running
+        for _ in range(len(self._queue)):
+            widget, update = self._queue.popleft()
+            state = batch.setdefault(widget, {})
+            if "colors" in update:
+                state.setdefault("colors", {}).update(update["colors"])
+            for key in ("text", "active"):
+                if key in update:
+                    state[key] = update[key]
+        self.drains += 1
+        for widget, state in batch.items():
+            if sip.isdeleted(widget):
+                continue
+            self.applied += 1
+            if "text" in state:
+                widget.setText(state["text"])
+            if "colors" in state:
+                widget.setColors(state["colors"])
+            if "active" in state:
+                if state["active"]:
+                    widget.start()
+                else:
+                    widget.stop()
+
+    def stats(self):
+        """posted calls, drains (gui-thread batches) and per-widget updates applied."""
+        return {"posted": self.posted, "drains": self.drains, "applied": self.applied,
+                "queued": len(self._queue)}
+
+
+def post_dispatcher():
+    """the process-wide dispatcher, created on first use and owned by the gui thread."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            dispatcher = PostDispatcher()
+            app = QCoreApplication.instance()
+            if app is not None and dispatcher.thread() is not app.thread():
+                dispatcher.moveToThread(app.thread()) # drains must run on the gui thread
+            _dispatcher = dispatcher
+        return _dispatcher
+
+
+def post_counters():
+    """post() statistics: posted, drains, applied, queued."""
+    return post_dispatcher().stats()
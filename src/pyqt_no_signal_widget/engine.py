@@ -0,0 +1,133 @@
+# engine.py
+
+import os
+import importlib.util
+from functools import lru_cache
+from PyQt6.QtCore import Qt, QCoreApplication
+from .scheme import register_scheme, install_scheme_handler
+from .bridge import install_channel_script
+
+# environment variable chromium reads its command-line switches from
+CHROMIUM_FLAGS_ENV = "QTWEBENGINE_CHROMIUM_FLAGS"
+
+_shared_profile = None
+
+# qtwebenginewidgets is imported lazily (see webengine_classes). importing it
+# after the qapplication exists is only allowed if this attribute was set first
+if QCoreApplication.instance() is None:
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+
+
+@lru_cache(maxsize=None)
+def webengine_installed():
+    """true if pyqt6-webengine is installed. checked without importing it."""
+    try:
+        return importlib.util.find_spec("PyQt6.QtWebEngineWidgets") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=None)
+def webengine_classes():
+    """
+    imports qtwebengine on first use, not when the package is imported, and
+    returns (qwebengineview, qwebenginepage), or none if it can't be imported
+    (not installed, or its system libraries are missing).
+    """
+    try:
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        from PyQt6.QtWebEngineCore import QWebEnginePage
+    except ImportError as error:
+        print(f"warning: qtwebengine could not be imported ({error}).")
+        return None
+    return QWebEngineView, QWebEnginePage
+
+
+def chromium_switches(process_per_site=True, renderer_process_limit=2, disable_gpu_rasterization=False):
+    """
+    builds the list of chromium switches for the requested process model.
+
+    args:
+        process_per_site (bool): pages of the same site share one renderer process.
+            every nosignalwidget page lives on the same local origin, so this
+            collapses them into a single renderer.
+        renderer_process_limit (int, optional): hard upper bound on renderer processes.
+            none or 0 leaves chromium's default (which scales with installed ram).
+        disable_gpu_rasterization (bool): rasterize on the cpu; useful on headless
+            or gpu-less boxes where gpu rasterization only adds a gpu process.
+    """
+    switches = []
+    if process_per_site:
+        switches.append("--process-per-site")
+    if renderer_process_limit:
+        switches.append(f"--renderer-process-limit={int(renderer_process_limit)}")
+    if disable_gpu_rasterization:
+        switches.append("--disable-gpu-rasterization")
+    return switches
+
+
+def configure_engine(process_per_site=True, renderer_process_limit=2, disable_gpu_rasterization=False,
+                     extra_switches=None):
+    """
+    applies the chromium process-model switches for all nosignalwidget pages
+    and registers the custom scheme the static page is served from.
+
+    chromium reads its switches once, when qtwebengine starts, so call this
+    before the first web engine object is created (ideally before the
+    qapplication). switches already present in QTWEBENGINE_CHROMIUM_FLAGS are
+    kept; a switch is only added if its name isn't set there yet.
+
+    args:
+        process_per_site, renderer_process_limit, disable_gpu_rasterization:
+            see chromium_switches().
+        extra_switches (list, optional): additional raw chromium switches.
+
+    returns:
+        str: the resulting QTWEBENGINE_CHROMIUM_FLAGS value.
+    """
+    if _shared_profile is not None:
+        print("warning: configure_engine called after the web engine started; switches only apply to new processes.")
+
+    switches = chromium_switches(process_per_site, renderer_process_limit, disable_gpu_rasterization)
+    switches.extend(extra_switches or [])
+
+    existing = os.environ.get(CHROMIUM_FLAGS_ENV, "").split()
+    existing_names = {flag.split("=", 1)[0] for flag in existing}
+    merged = existing + [flag for flag in switches if flag.split("=", 1)[0] not in existing_names]
+    os.environ[CHROMIUM_FLAGS_ENV] = " ".join(merged)
+    if webengine_classes() is not None: # without qtwebengine, widgets use the native backend
+        register_scheme()
+    return os.environ[CHROMIUM_FLAGS_ENV]
+
+
+def shared_profile():
+    """
+    returns the web engine profile shared by every nosignalwidget page.
+
+    the profile is off-the-record (nothing is written to disk), has the http
+    cache and persistent cookies disabled, and carries the page settings once
+    instead of each page setting them individually. the static page resources
+    are served to it by the scheme handler (see scheme.py), and qwebchannel.js
+    is injected into its pages once (see bridge.py). it is created on first
+    use and parented to the application so it outlives all pages.
+    """
+    global _shared_profile
+    if _shared_profile is None:
+        from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEngineSettings
+
+        profile = QWebEngineProfile(QCoreApplication.instance()) # no storage name -> off-the-record
+        profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.NoCache)
+        profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.NoPersistentCookies)
+        profile.setSpellCheckEnabled(False)
+
+        settings = profile.settings()
+        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
+        # pages never need the network
+        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, False)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.ScrollAnimatorEnabled, False)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadIconsForPage, False)
+        install_scheme_handler(profile)
+        install_channel_script(profile)
+        _shared_profile = profile
+    return _shared_profile
@@ -0,0 +1,294 @@
+# loop.py
+#
+# pre-rendered animation loops: the message box movement is deterministic, so
+# one cycle can be rendered offline once per (text, palette, size) and played
+# back by blitting frames from a memory-mapped file.
+#
+# export (the no-signal-export-loop tool, or export_loop()):
+#     QT_QPA_PLATFORM=offscreen no-signal-export-loop feed.nsloop --text "FEED 1" --size 320x180
+#
+# playback:
+#     NoSignalWidget(initial_text="FEED 1", backend="loop", loop_file="feed.nsloop")
+
+import os
+import sys
+import json
+import mmap
+import struct
+import argparse
+from array import array
+from itertools import groupby
+from collections import OrderedDict
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QImage, QPainter
+from .native_view import (NativeNoSignalView, BAR_VARIABLES, MOVE_X_MS, MOVE_Y_MS, FRAME_INTERVAL_MS,
+                          paint_color_bars, paint_message_box)
+from .assets import register_native_font
+from .snapshot import resolve_palette
+
+# file layout (little endian):
+#   header   magic, version, encoding, pixel width, pixel height, device pixel
+#            ratio, frame count, frame interval (ms), metadata length
+#   metadata json: text, resolved colors, logical size, loop length, shadow
+#   index    frame count x (offset, length) of each frame's data
+#   frames   raw: premultiplied argb32 scanlines, 16-byte aligned
+#            rle: runs of (count, 4 pixel bytes)
+LOOP_MAGIC = b"NSLOOP\r\n"
+LOOP_VERSION = 1
+HEADER = struct.Struct("<8sHHIIdIdI")
+INDEX_ENTRY = struct.Struct("<QI")
+RUN = struct.Struct("<I4s")
+
+ENCODING_RAW = "raw"
+ENCODING_RLE = "rle"
+_ENCODINGS = (ENCODING_RAW, ENCODING_RLE) # position is the header code
+
+# the two axes bounce with different periods (7.05 s and 7.4 s), so the exact
+# cycle is their least common multiple, about 35 minutes. the loop instead
+# runs each axis one round trip in the mean of the two round trips, a ~2.5%
+# speed change per axis that makes the loop seamless and only 14.45 s long.
+LOOP_MS = MOVE_X_MS + MOVE_Y_MS
+
+# variables a loop's frames depend on (the bars, the text and its shadow)
+LOOP_VARIABLES = tuple(sorted(set(BAR_VARIABLES) | {"--text-color"}))
+
+_FORMAT = QImage.Format.Format_ARGB32_Premultiplied
+_open_loops = {} # real path -> loopfile, shared by every widget in the process
+
+
+def _rle_encode(data):
+    """run-length encodes premultiplied argb32 pixel data."""
+    pixels = array("I", data)
+    return b"".join(RUN.pack(len(list(run)), value.to_bytes(4, sys.byteorder)) for value, run in groupby(pixels))
+
+
+def _rle_decode(data):
+    return b"".join(pixel * count for count, pixel in RUN.iter_unpack(data))
+
+
+def export_loop(path, text="NO SIGNAL", colors=None, size=(320, 180), device_pixel_ratio=1.0, fps=30,
+                encoding=ENCODING_RLE, shadow=True):
+    """
+    renders one seamless cycle of the animation into a loop file.
+
+    the frames are painted by the native renderer. a qguiapplication must
+    exist (fonts). the file is written next to path and moved over it at the
+    end, so processes that have the old file mapped keep a consistent copy.
+
+    args:
+        path (str): file to write.
+        text (str): message text.
+        colors (dict, optional): css variable -> color value or predefined
+            name, applied over the widget defaults.
+        size ((int, int)): logical frame size; play it back at this size to
+            blit frames unscaled.
+        device_pixel_ratio (float): pixel density of the frames.
+        fps (float): frames per second of the loop.
+        encoding (str): 'rle' (compact, decoded on playback) or 'raw'
+            (larger, blitted straight from the mapping).
+        shadow (bool): draw the text drop shadow.
+
+    returns:
+        dict: frames, frame_interval_ms, bytes (file size).
+    """
+    if encoding not in _ENCODINGS:
+        raise ValueError(f"unknown encoding '{encoding}'. expected 'raw' or 'rle'.")
+    register_native_font()
+    width, height = size
+    palette = resolve_palette(colors)
+    frame_count = max(1, round(LOOP_MS * fps / 1000.0))
+    interval = LOOP_MS / frame_count
+    pixel_width, pixel_height = round(width * device_pixel_ratio), round(height * device_pixel_ratio)
+    rect = QRectF(0, 0, width, height)
+
+    bars = QImage(pixel_width, pixel_height, _FORMAT)
+    bars.setDevicePixelRatio(device_pixel_ratio)
+    bars.fill(Qt.GlobalColor.black)
+    painter = QPainter(bars)
+    paint_color_bars(painter, rect, palette)
+    painter.end()
+
+    frames = []
+    for index in range(frame_count):
+        elapsed = index * interval
+        frame = bars.copy()
+        painter = QPainter(frame)
+        paint_message_box(painter, rect, palette, text, elapsed * 2 * MOVE_X_MS / LOOP_MS, 1.0, shadow,
+                          elapsed * 2 * MOVE_Y_MS / LOOP_MS)
+        painter.end()
+        data = frame.constBits().asstring(frame.sizeInBytes())
+        frames.append(data if encoding == ENCODING_RAW else _rle_encode(data))
+
+    meta = json.dumps({"text": text, "colors": palette, "size": [width, height], "loop_ms": LOOP_MS,
+                       "shadow": shadow}).encode("utf-8")
+    offset = HEADER.size + len(meta) + INDEX_ENTRY.size * frame_count
+    index_entries = []
+    for data in frames:
+        offset += -offset % 16
+        index_entries.append((offset, len(data)))
+        offset += len(data)
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(HEADER.pack(LOOP_MAGIC, LOOP_VERSION, _ENCODINGS.index(encoding), pixel_width, pixel_height,
+                            device_pixel_ratio, frame_count, interval, len(meta)))
+        f.write(meta)
+        for entry in index_entries:
+            f.write(INDEX_ENTRY.pack(*entry))
+        for (frame_offset, _), data in zip(index_entries, frames):
+            f.write(b"\0" * (frame_offset - f.tell()))
+            f.write(data)
+    os.replace(temporary, path)
+    return {"frames": frame_count, "frame_interval_ms": interval, "bytes": os.path.getsize(path)}
+
+
+class LoopFile:
+    """
+    a memory-mapped loop file.
+
+    the mapping is read-only, so every process playing the same file shares
+    its pages through the os page cache. within a process use open_loop(),
+    which shares one loopfile (and its small cache of decoded rle frames)
+    between all widgets.
+    """
+
+    def __init__(self, path, decoded_frames=8):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, encoding, self.pixel_width, self.pixel_height, self.device_pixel_ratio,
+             self.frame_count, self.frame_interval_ms, meta_length) = HEADER.unpack_from(self._map)
+        except struct.error:
+            raise ValueError(f"{path} is not a loop file.")
+        if magic != LOOP_MAGIC or version != LOOP_VERSION or encoding >= len(_ENCODINGS):
+            raise ValueError(f"{path} is not a version {LOOP_VERSION} loop file.")
+        self.encoding = _ENCODINGS[encoding]
+        self.meta = json.loads(self._map[HEADER.size:HEADER.size + meta_length].decode("utf-8"))
+        self.text = self.meta["text"]
+        self.colors = self.meta["colors"]
+        start = HEADER.size + meta_length
+        self._index = list(INDEX_ENTRY.iter_unpack(self._map[start:start + INDEX_ENTRY.size * self.frame_count]))
+        self._view = memoryview(self._map)
+        self._decoded = OrderedDict() # frame index -> (pixel data, qimage), rle only
+        self._max_decoded = decoded_frames
+
+    def logical_size(self):
+        """(width, height) of a frame in logical pixels."""
+        return tuple(self.meta["size"])
+
+    def matches(self, text, colors, shadow=True):
+        """
+        true if the loop was rendered for this text, these resolved colors and
+        this shadow setting. the text is compared case-insensitively, since
+        both renderers draw it uppercased.
+        """
+        return (text.upper() == self.text.upper() and shadow == self.meta.get("shadow", True)
+                and all(colors.get(key) == self.colors.get(key) for key in LOOP_VARIABLES))
+
+    def frame(self, index):
+        """returns frame index as a qimage (raw: backed by the mapping, no copy)."""
+        index %= self.frame_count
+        if self.encoding == ENCODING_RAW:
+            offset, length = self._index[index]
+            image = QImage(self._view[offset:offset + length], self.pixel_width, self.pixel_height,
+                           self.pixel_width * 4, _FORMAT)
+        else:
+            cached = self._decoded.get(index)
+            if cached is not None:
+                self._decoded.move_to_end(index)
+                return cached[1]
+            offset, length = self._index[index]
+            data = _rle_decode(self._view[offset:offset + length])
+            image = QImage(data, self.pixel_width, self.pixel_height, self.pixel_width * 4, _FORMAT)
+            self._decoded[index] = (data, image) # the image doesn't own its pixels
+            while len(self._decoded) > self._max_decoded:
+                self._decoded.popitem(last=False)
+        image.setDevicePixelRatio(self.device_pixel_ratio)
+        return image
+
+    def frame_at(self, elapsed_ms):
+        """returns the frame shown elapsed_ms after the animation started."""
+        return self.frame(int(elapsed_ms // self.frame_interval_ms))
+
+
+def open_loop(path):
+    """returns the process-wide loopfile for path, mapping it on first use."""
+    key = os.path.realpath(path)
+    loop = _open_loops.get(key)
+    if loop is None:
+        loop = _open_loops[key] = LoopFile(path)
+    return loop
+
+
+class LoopPlaybackView(NativeNoSignalView):
+    """
+    a native view that plays the running animation from a loop file.
+
+    while the animation runs at full opacity with the text, colors and shadow
+    setting the loop was rendered for, each frame is one blit (unscaled when
+    the view has the loop's size). everything else, such as the box fading in
+    and out, the stop fade, a quality tier without the shadow or text and
+    colors that differ from the loop, is painted by the native view as
+    usual. frames are produced no faster than the loop's frame rate.
+    """
+
+    def __init__(self, loop, text="", colors=None, parent=None):
+        super().__init__(text, colors, parent)
+        self._loop = loop
+        self._frame_timer.setInterval(max(FRAME_INTERVAL_MS, round(loop.frame_interval_ms)))
+
+    def loop(self):
+        return self._loop
+
+    def setQuality(self, settings):
+        super().setQuality(settings)
+        self._frame_timer.setInterval(max(self._frame_timer.interval(), round(self._loop.frame_interval_ms)))
+
+    def isPlaying(self):
+        """true while frames come from the loop file."""
+        return (self._active and self._clock.isValid() and self._box_opacity() >= 1.0
+                and self._black_level() <= 0.0 and self._loop.matches(self._text, self._colors, self._shadow))
+
+    def _update_frame_region(self):
+        if self.isPlaying():
+            self.update()
+        else:
+            super()._update_frame_region()
+
+    def paintEvent(self, event):
+        if not self.isPlaying():
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        rect = QRectF(self.rect())
+        painter.drawImage(rect, self._loop.frame_at(self._clock.elapsed()))
+        painter.end()
+        self._box_rect = rect # the loop's box isn't where the native one would be; repaint all on switching back
+
+
+def main():
+    parser = argparse.ArgumentParser(description="renders one NoSignalWidget animation cycle into a loop file")
+    parser.add_argument("output", help="loop file to write")
+    parser.add_argument("--text", default="NO SIGNAL")
+    parser.add_argument("--size", default="320x180", help="logical WIDTHxHEIGHT")
+    parser.add_argument("--ratio", type=float, default=1.0, help="device pixel ratio")
+    parser.add_argument("--fps", type=float, default=30)
+    parser.add_argument("--encoding", choices=_ENCODINGS, default=ENCODING_RLE)
+    parser.add_argument("--color", action="append", default=[], metavar="--VAR=VALUE",
+                        help="css variable override, e.g. --color=--red=bright_red (repeatable)")
+    parser.add_argument("--no-shadow", action="store_true")
+    args = parser.parse_args()
+
+    from PyQt6.QtGui import QGuiApplication
+    app = QGuiApplication(sys.argv)
+    width, height = (int(value) for value in args.size.lower().split("x"))
+    colors = dict(item.split("=", 1) for item in args.color)
+    result = export_loop(args.output, args.text, colors, (width, height), args.ratio, args.fps,
+                         args.encoding, not args.no_shadow)
+    print(f"info: wrote {result['frames']} frames ({result['frame_interval_ms']:.1f} ms apart, "
+          f"{result['bytes'] / 1024:.0f} KiB) to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
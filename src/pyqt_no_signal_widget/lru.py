@@ -0,0 +1,44 @@
+# lru.py
+
+from collections import OrderedDict
+
+
+class LruCache:
+    """
+    bounded lru cache with hit/miss counters.
+
+    the base of the package's rendered-frame caches (bar layers, snapshots).
+    subclasses build the key and the value; get() handles lookup, recency,
+    eviction and the counters.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, render):
+        """returns the entry for key, calling render() to create it on a miss."""
+        value = self._entries.get(key)
+        if value is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = self._entries[key] = render()
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """drops all entries and resets the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """returns hit/miss counters and occupancy as a dict."""
+        return {"hits": self.hits, "misses": self.misses,
+                "entries": len(self._entries), "max_entries": self.max_entries}
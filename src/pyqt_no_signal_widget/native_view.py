@@ -0,0 +1,480 @@
+# native_view.py
+
+from functools import lru_cache
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QElapsedTimer, QRect, QRectF, QPointF, QMargins, QEasingCurve
+from PyQt6.QtGui import QColor, QPainter, QFont, QPen, QFontMetrics, QFontMetricsF, QPixmap
+from .colors import parse_css_color
+from .assets import register_native_font
+from .lru import LruCache
+
+# css variable used by each of the 18 color bar spans, row by row (mirrors html_template)
+BAR_ROWS = (
+    ("--yellow", "--light-blue", "--green", "--purple", "--red", "--blue"),
+    ("--blue", "--purple", "--black", "--light-blue", "--black", "--white"),
+    ("--navy", "--white", "--dark-purple", "--black", "--gray", "--black"),
+)
+BAR_ROW_WEIGHTS = (4, 1, 1) # grid-template-rows: 4fr 1fr 1fr
+BAR_BRIGHTNESS = 0.95 # filter: brightness(0.95)
+# every css variable the bar layer depends on
+BAR_VARIABLES = tuple(sorted({variable for row in BAR_ROWS for variable in row} | {"--black"}))
+
+# timings taken from the css keyframes and transitions
+MOVE_X_MS = 7050
+MOVE_Y_MS = 7400
+BOX_FADE_MS = 300
+STOP_FADE_MS = 500 # fade to black on stop (same as the nosignalwidget overlay)
+FRAME_INTERVAL_MS = 16
+
+# easings accepted by transitioncolors (the page uses the same cubic curves)
+EASING_CURVES = {
+    "linear": QEasingCurve.Type.Linear,
+    "ease-in": QEasingCurve.Type.InCubic,
+    "ease-out": QEasingCurve.Type.OutCubic,
+    "ease-in-out": QEasingCurve.Type.InOutCubic,
+}
+
+BOX_BACKGROUND = QColor(19, 20, 23, 89) # rgba(19, 20, 23, 0.35)
+BOX_BORDER = QColor(255, 255, 255, 46) # rgba(255, 255, 255, 0.18)
+BOX_RADIUS = 10
+
+def _bounce(elapsed_ms, period_ms):
+    """position (0..1) of a linear 'infinite alternate' css animation after elapsed_ms."""
+    phase = elapsed_ms % (2 * period_ms)
+    if phase > period_ms:
+        phase = 2 * period_ms - phase
+    return phase / period_ms
+
+
+def _bar_color(colors, variable):
+    """resolves a bar css variable to a qcolor with the span brightness filter applied."""
+    color = parse_css_color(colors.get(variable, ""))
+    if not color.isValid():
+        color = QColor(0, 0, 0)
+    return QColor.fromRgbF(color.redF() * BAR_BRIGHTNESS, color.greenF() * BAR_BRIGHTNESS,
+                           color.blueF() * BAR_BRIGHTNESS, color.alphaF())
+
+
+def paint_color_bars(painter, rect, colors):
+    """paints the 3-row color bar grid into rect."""
+    painter.fillRect(rect, _bar_color(colors, "--black")) # body background
+    total_weight = sum(BAR_ROW_WEIGHTS)
+    column_width = rect.width() / 6.0
+    y = rect.top()
+    for row, weight in zip(BAR_ROWS, BAR_ROW_WEIGHTS):
+        row_height = rect.height() * weight / total_weight
+        for column, variable in enumerate(row):
+            painter.fillRect(QRectF(rect.left() + column * column_width, y, column_width, row_height),
+                             _bar_color(colors, variable))
+        y += row_height
+
+
+class BarLayerCache(LruCache):
+    """
+    bounded lru cache of pre-rendered color bar layers.
+
+    the bars never move, so they are rasterized once per (size, device pixel
+    ratio, bar palette) and only the message box is painted per frame. the
+    cache is shared by every native view, so widgets with the same size and
+    palette share one pixmap.
+    """
+
+    def __init__(self, max_entries=32):
+        super().__init__(max_entries)
+
+    @staticmethod
+    def key(width, height, device_pixel_ratio, colors):
+        """cache key; only the css variables used by the bars are part of it."""
+        return (width, height, device_pixel_ratio, tuple(colors.get(variable) for variable in BAR_VARIABLES))
+
+    def pixmap(self, width, height, device_pixel_ratio, colors):
+        """returns the bar layer for the given logical size, rendering it on a miss."""
+        def render():
+            pixmap = QPixmap(max(1, round(width * device_pixel_ratio)), max(1, round(height * device_pixel_ratio)))
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            painter = QPainter(pixmap)
+            paint_color_bars(painter, QRectF(0, 0, width, height), colors)
+            painter.end()
+            return pixmap
+        return self.get(self.key(width, height, device_pixel_ratio, colors), render)
+
+
+# shared by all native views
+bar_layer_cache = BarLayerCache()
+
+
+def paint_cached_color_bars(painter, rect, colors, device_pixel_ratio):
+    """paints the color bars from the shared layer cache."""
+    width, height = round(rect.width()), round(rect.height())
+    if width <= 0 or height <= 0:
+        return
+    painter.drawPixmap(rect.topLeft(), bar_layer_cache.pixmap(width, height, device_pixel_ratio, colors))
+
+
+def message_box_font(vmin):
+    """font used for the message text (michroma, falling back to the system sans-serif)."""
+    font = QFont("Michroma")
+    font.setStyleHint(QFont.StyleHint.SansSerif)
+    font.setPixelSize(max(1, round(3.5 * vmin)))
+    font.setCapitalization(QFont.Capitalization.AllUppercase)
+    return font
+
+
+def _message_box_layout(rect, text, elapsed_ms, elapsed_y_ms=None):
+    """returns (box, text_box, font, flags) for the message box at elapsed_ms."""
+    vw = rect.width() / 100.0
+    vh = rect.height() / 100.0
+    vmin = min(vw, vh)
+
+    font = message_box_font(vmin)
+    metrics = QFontMetricsF(font)
+    box_width = 30 * vw
+    text_rect = QRectF(0, 0, max(1.0, box_width - 2 * vmin), 1e6)
+    flags = int(Qt.AlignmentFlag.AlignHCenter | Qt.TextFlag.TextWordWrap)
+    text_height = metrics.boundingRect(text_rect, flags, text).height()
+    box_height = text_height + 6 * vmin
+
+    left = rect.left() + _bounce(elapsed_ms, MOVE_X_MS) * (100 * vw - 30 * vw)
+    top = rect.top() + _bounce(elapsed_ms if elapsed_y_ms is None else elapsed_y_ms, MOVE_Y_MS) * (100 * vh - 10 * vmin)
+    box = QRectF(left, top, box_width, box_height)
+    text_box = QRectF(box.left() + vmin, box.top() + 3 * vmin, box_width - 2 * vmin, text_height)
+    return box, text_box, font, flags
+
+
+def message_box_rect(rect, text, elapsed_ms):
+    """the area touched when painting the message box, including the text shadow."""
+    if rect.width() <= 0 or rect.height() <= 0:
+        return QRectF()
+    box, text_box, _, _ = _message_box_layout(rect, text, elapsed_ms)
+    return box.united(text_box.translated(5, 5)).adjusted(-2, -2, 2, 2)
+
+
+def paint_message_box(painter, rect, colors, text, elapsed_ms, opacity, shadow=True, elapsed_y_ms=None):
+    """
+    paints the floating message box at the position the css keyframes would place it.
+
+    args:
+        painter (qpainter): active painter.
+        rect (qrectf): the area standing in for the page viewport.
+        colors (dict): css variable -> css color string.
+        text (str): message text.
+        elapsed_ms (float): time since the movement animation started (0 keeps it at the origin).
+        opacity (float): 0..1, mirrors the css opacity transition.
+        shadow (bool): draw the text drop shadow (off in the 'minimal' quality tier).
+        elapsed_y_ms (float, optional): separate time for the vertical movement
+            (the loop exporter runs the two axes at slightly different speeds).
+    """
+    if opacity <= 0.0 or rect.width() <= 0 or rect.height() <= 0:
+        return
+    box, text_box, font, flags = _message_box_layout(rect, text, elapsed_ms, elapsed_y_ms)
+
+    painter.save()
+    painter.setOpacity(opacity)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.setPen(QPen(BOX_BORDER, 1))
+    painter.setBrush(BOX_BACKGROUND)
+    painter.drawRoundedRect(box.adjusted(0.5, 0.5, -0.5, -0.5), BOX_RADIUS, BOX_RADIUS)
+
+    text_color = parse_css_color(colors.get("--text-color", ""))
+    if not text_color.isValid():
+        text_color = QColor(255, 255, 255)
+    shadow_color = parse_css_color(colors.get("--black", ""))
+    if not shadow_color.isValid():
+        shadow_color = QColor(0, 0, 0)
+    shadow_color.setAlphaF(shadow_color.alphaF() * 0.6)
+
+    painter.setFont(font)
+    if shadow:
+        painter.setPen(shadow_color) # approximates drop-shadow(5px 5px 8px var(--black))
+        painter.drawText(text_box.translated(5, 5), flags, text)
+    painter.setPen(text_color)
+    painter.drawText(text_box, flags, text)
+    painter.restore()
+
+
+STOP_INDICATOR_TEXT = "⛔️"
+STOP_INDICATOR_POINT_SIZE = 48
+
+
+@lru_cache(maxsize=16)
+def stop_indicator_pixmap(device_pixel_ratio, pixel_size=None):
+    """
+    the stop indicator glyph rendered once per device pixel ratio (and glyph
+    size), so the emoji font fallback is resolved a single time instead of on
+    every show or paint. pixel_size overrides the default point size, e.g.
+    for wall tiles whose glyph scales with the tile.
+    """
+    font = QFont()
+    if pixel_size is None:
+        font.setPointSize(STOP_INDICATOR_POINT_SIZE)
+    else:
+        font.setPixelSize(pixel_size)
+    size = QFontMetrics(font).boundingRect(STOP_INDICATOR_TEXT).size().grownBy(QMargins(4, 4, 4, 4))
+    pixmap = QPixmap(round(size.width() * device_pixel_ratio), round(size.height() * device_pixel_ratio))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.setPen(QColor("lightgray"))
+    painter.drawText(QRect(0, 0, size.width(), size.height()), Qt.AlignmentFlag.AlignCenter, STOP_INDICATOR_TEXT)
+    painter.end()
+    return pixmap
+
+
+def paint_stop_indicator(painter, rect, pixel_size=None):
+    """draws the cached stop indicator centered in rect (see stop_indicator_pixmap)."""
+    pixmap = stop_indicator_pixmap(painter.device().devicePixelRatioF(), pixel_size)
+    size = pixmap.deviceIndependentSize()
+    painter.drawPixmap(QPointF(rect.left() + (rect.width() - size.width()) / 2,
+                               rect.top() + (rect.height() - size.height()) / 2), pixmap)
+
+
+class NativeNoSignalView(QWidget):
+    """
+    a qpainter-based stand-in for the qwebengineview used by nosignalwidget.
+
+    draws the same color bars and bouncing message box without a chromium
+    renderer. the control methods deliberately mirror the page's javascript
+    functions (updatetext, updatecolors, startanimation, stopanimation) so the
+    owning widget can drive either backend the same way. the backdrop blur of
+    the message box is not reproduced.
+
+    with setpagefade(true) the view also paints the fade to black and the stop
+    indicator itself, like the page does in the 'page' fade mode.
+    """
+
+    fadeFinished = pyqtSignal(bool) # a page fade ended; true if stopped (like the page's reportfade)
+
+    def __init__(self, text="", colors=None, parent=None):
+        super().__init__(parent)
+        register_native_font()
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self._text = text
+        self._colors = dict(colors or {})
+        self._active = False
+        self._clock = QElapsedTimer() # movement time since startanimation
+        self._fade_clock = QElapsedTimer() # time since the last visibility change of the box
+        self._box_rect = QRectF() # area covered by the box in the last painted frame
+        self._page_fade = False
+        self._stopped = False # stop state of the page fade
+        self._stop_clock = QElapsedTimer() # time since the last page fade started
+
+        self._frozen = False # no frames at all while frozen (see setfrozen)
+        self._shadow = True
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self._on_frame)
+        self._frame_clock = QElapsedTimer() # interval between frames, for takeframestats
+        self._frame_deltas = []
+        self._tweens = {} # css variable -> (from, to, target value, clock, duration ms, easing curve)
+
+    # --- page-equivalent control functions ---
+    def updateText(self, text):
+        """equivalent of the page's updatetext()."""
+        self._text = text
+        self.update()
+
+    def updateColors(self, color_map):
+        """equivalent of the page's updatecolors()."""
+        for key, value in color_map.items():
+            if key.startswith("--"):
+                self._tweens.pop(key, None)
+                self._colors[key] = value
+        self.update()
+
+    def transitionColors(self, color_map, duration_ms, easing):
+        """equivalent of the page's transitioncolors(): interpolates the colors on the frame timer."""
+        for key, value in color_map.items():
+            if not key.startswith("--"):
+                continue
+            start, end = parse_css_color(self._colors.get(key, "")), parse_css_color(value)
+            if not start.isValid() or not end.isValid() or duration_ms <= 0:
+                self._tweens.pop(key, None)
+                self._colors[key] = value
+                continue
+            clock = QElapsedTimer()
+            clock.start()
+            self._tweens[key] = (start, end, value, clock, duration_ms, QEasingCurve(EASING_CURVES[easing]))
+        self._update_frame_timer()
+        self.update()
+
+    def _advance_tweens(self):
+        """moves the running color transitions to the current time."""
+        for key, (start, end, value, clock, duration, curve) in list(self._tweens.items()):
+            progress = clock.elapsed() / duration
+            if progress >= 1.0:
+                self._colors[key] = value
+                del self._tweens[key]
+                continue
+            k = curve.valueForProgress(progress)
+            self._colors[key] = (f"rgba({round(start.red() + (end.red() - start.red()) * k)}, "
+                                 f"{round(start.green() + (end.green() - start.green()) * k)}, "
+                                 f"{round(start.blue() + (end.blue() - start.blue()) * k)}, "
+                                 f"{start.alphaF() + (end.alphaF() - start.alphaF()) * k:.3f})")
+
+    def setPageFade(self, enabled):
+        """equivalent of the page's setpagefade()."""
+        self._page_fade = enabled
+        self.update()
+
+    @staticmethod
+    def _restart(clock, immediate):
+        """starts a transition clock, or skips the transition if immediate."""
+        if immediate:
+            clock.invalidate()
+        else:
+            clock.start()
+
+    def startAnimation(self, immediate=False):
+        """equivalent of the page's startanimation(); restarts the movement like re-adding the css class."""
+        if not self._active:
+            self._active = True
+            self._clock.start()
+            self._restart(self._fade_clock, immediate)
+        if self._stopped:
+            self._stopped = False
+            self._restart(self._stop_clock, immediate)
+        self._update_frame_timer()
+        self.update()
+
+    def stopAnimation(self, immediate=False):
+        """equivalent of the page's stopanimation()."""
+        if self._active:
+            self._active = False
+            self._restart(self._fade_clock, immediate)
+        if not self._stopped:
+            self._stopped = True
+            self._restart(self._stop_clock, immediate)
+        self._update_frame_timer()
+        self.update()
+
+    def setFrozen(self, frozen):
+        """equivalent of freezing the page's lifecycle state: stops producing frames, keeps all state."""
+        if self._frozen != frozen:
+            self._frozen = frozen
+            self._update_frame_timer()
+
+    def isFrozen(self):
+        return self._frozen
+
+    def setQuality(self, settings):
+        """
+        equivalent of the page's setquality(): caps the frame rate (the box
+        moves in steps) and toggles the text shadow. there is no backdrop blur
+        to drop.
+
+        args:
+            settings (dict): a nosignalwidget.quality_tiers entry.
+        """
+        fps = settings.get("fps") or 0
+        self._frame_timer.setInterval(max(FRAME_INTERVAL_MS, round(1000 / fps)) if fps else FRAME_INTERVAL_MS)
+        self._shadow = settings.get("shadow", True)
+        self.update()
+
+    def takeFrameStats(self):
+        """
+        equivalent of the page's takeframestats(): the average interval
+        between the frames painted since the last call, the target interval
+        (the frame timer's), the number of intervals and how many frames were
+        missed in them, or none if too few frames were painted.
+        """
+        deltas, self._frame_deltas = self._frame_deltas, []
+        if len(deltas) < 2:
+            return None
+        target = self._frame_timer.interval()
+        return {"avg": sum(deltas) / len(deltas), "target": target, "frames": len(deltas),
+                "dropped": sum(max(0, round(delta / target) - 1) for delta in deltas)}
+
+    # --- painting ---
+    def _box_opacity(self):
+        """current opacity of the message box, following the 0.3s css transition."""
+        if not self._fade_clock.isValid():
+            return 1.0 if self._active else 0.0
+        progress = min(self._fade_clock.elapsed() / BOX_FADE_MS, 1.0)
+        return progress if self._active else 1.0 - progress
+
+    def _stop_fade_progress(self):
+        """0..1 progress of the page fade transition."""
+        if not self._stop_clock.isValid():
+            return 1.0
+        return min(self._stop_clock.elapsed() / STOP_FADE_MS, 1.0)
+
+    def _black_level(self):
+        """opacity of the page fade layer."""
+        if not self._page_fade:
+            return 0.0
+        progress = self._stop_fade_progress()
+        return progress if self._stopped else 1.0 - progress
+
+    def _is_animating(self):
+        """true while anything on screen changes from frame to frame."""
+        if self._page_fade and self._stop_fade_progress() < 1.0:
+            return True
+        if self._page_fade and self._stopped:
+            return False # fully black; nothing below is visible
+        return self._active or self._box_opacity() > 0.0 or bool(self._tweens)
+
+    def _update_frame_timer(self):
+        """runs the frame timer only while visible, not frozen and animating."""
+        if self.isVisible() and not self._frozen and self._is_animating():
+            if not self._frame_timer.isActive():
+                self._frame_clock.invalidate() # don't count the idle gap as a frame
+                self._frame_timer.start()
+        else:
+            self._frame_timer.stop()
+
+    def _elapsed(self):
+        # once the class is removed the box snaps back to the origin while fading out
+        return self._clock.elapsed() if self._active and self._clock.isValid() else 0
+
+    def _on_frame(self):
+        if self._frame_clock.isValid():
+            self._frame_deltas.append(self._frame_clock.restart())
+            del self._frame_deltas[:-120] # bounded between samples
+        else:
+            self._frame_clock.start()
+        self._update_frame_region()
+        if self._page_fade and self._stop_clock.isValid() and self._stop_fade_progress() >= 1.0:
+            self._stop_clock.invalidate() # same as a finished fade from here on
+            self.fadeFinished.emit(self._stopped)
+        if not self._is_animating():
+            self._frame_timer.stop()
+
+    def _update_frame_region(self):
+        """schedules the repaint of the next frame."""
+        if self._tweens:
+            self._advance_tweens()
+            self.update() # the bars change color
+        elif self._page_fade and self._stop_fade_progress() < 1.0:
+            self.update() # the whole view fades
+        else:
+            # only the area the box leaves and enters needs repainting; the bars come from the cache
+            new_rect = message_box_rect(QRectF(self.rect()), self._text, self._elapsed())
+            self.update(self._box_rect.united(new_rect).toAlignedRect())
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = QRectF(self.rect())
+        painter.setClipRect(event.rect())
+        if self._tweens:
+            paint_color_bars(painter, rect, self._colors) # in-between palettes would churn the layer cache
+        else:
+            paint_cached_color_bars(painter, rect, self._colors, self.devicePixelRatioF())
+        elapsed = self._elapsed()
+        paint_message_box(painter, rect, self._colors, self._text, elapsed, self._box_opacity(), self._shadow)
+        self._box_rect = message_box_rect(rect, self._text, elapsed)
+        black = self._black_level()
+        if black > 0.0:
+            painter.setOpacity(black)
+            painter.fillRect(rect, QColor(0, 0, 0))
+            paint_stop_indicator(painter, rect) # fades with the black layer, like the page's div.fade
+            painter.setOpacity(1.0)
+        painter.end()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_frame_timer()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._frame_timer.stop()
@@ -1,31 +1,97 @@
 # PyQTNoSignalAnimation.py -> Renamed to no_signal_widget.py
 
+import os
+import re
 import sys
+import asyncio
 import json
+import time
+import weakref
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QFrame, QLabel # Added QLabel
+    QWidget, QVBoxLayout, QFrame
 )
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings
-from PyQt6.QtCore import Qt, pyqtSlot, QUrl, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect, pyqtProperty
-from PyQt6.QtGui import QColor, QPainter, QFont # Added QFont
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, pyqtSlot, QUrl, pyqtSignal, QTimer, QEvent, QElapsedTimer, QPropertyAnimation, QEasingCurve, QPointF, QRectF, QSize, pyqtProperty
+from PyQt6.QtGui import QColor, QPainter
+from .native_view import NativeNoSignalView, STOP_INDICATOR_TEXT, STOP_FADE_MS, EASING_CURVES, stop_indicator_pixmap
+from .snapshot import snapshot_cache
+from .loop import LoopPlaybackView, open_loop
+from .colors import normalize_css_color
+from .assets import font_face_css, asset_bytes, FONT_FILE
+from .engine import shared_profile, webengine_installed, webengine_classes
+from .bridge import attach_bridge
+from .budget import register_page, schedule_enforce, count_page_event
+from .textstream import start_stream, stop_stream, is_streaming
+from .dispatch import post_dispatcher
+from .scheme import add_resource, resource_url, register_scheme, is_scheme_registered
+
+# qtwebengine is optional: without it (or without its system libraries) the
+# widget falls back to the native qpainter backend. it is only imported once a
+# web view is actually created (see engine.webengine_classes).
+
+BACKEND_AUTO = "auto"
+BACKEND_WEB = "web"
+BACKEND_NATIVE = "native"
+BACKEND_LOOP = "loop"
+
+# how start()/stop() fade to black: a qt overlay widget stacked on the view,
+# or a css transition inside the page (no overlay widget at all)
+FADE_OVERLAY = "overlay"
+FADE_PAGE = "page"
+
+# rendering quality tiers (see nosignalwidget.quality_tiers); 'auto' starts at
+# 'full' and steps down while frames take too long
+QUALITY_FULL = "full"
+QUALITY_BALANCED = "balanced"
+QUALITY_MINIMAL = "minimal"
+QUALITY_AUTO = "auto"
+
+# static page served by the scheme handler; per-instance state is sent after load
+PAGE_PATH = "index.html"
+FONT_PATH = "fonts/" + FONT_FILE
+
+
+# every nosignalwidget alive, for aggregatemetrics()
+_live_widgets = weakref.WeakSet()
+_sethtml_fallback_reported = False
+
+
+def _resolve(futures, result=None):
+    """completes the asyncio futures that are still pending (cancelled ones are skipped)."""
+    for future in futures:
+        if not future.done():
+            future.set_result(result)
+
+
+def _minify_html(html):
+    """strips comments and collapses whitespace in the page template (css and js included)."""
+    html = re.sub(r"/\*.*?\*/", "", html, flags=re.DOTALL) # css comments
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.DOTALL)
+    html = re.sub(r"<script>.*?</script>", # js line comments
+                  lambda m: re.sub(r"(^|\s)//.*$", "", m.group(0), flags=re.MULTILINE), html, flags=re.DOTALL)
+    html = re.sub(r"\s+", " ", html)
+    html = re.sub(r">\s+<", "><", html)
+    return re.sub(r"\s*([{};,])\s*", r"\1", html).strip()
 
 # Helper class for the fade overlay
 class OverlayWidget(QWidget):
-    """a simple overlay widget for fade effects."""
+    """
+    a simple overlay widget for fade effects. the fade color and the stop
+    indicator are painted directly in paintevent; no stylesheet is involved,
+    so animating the color doesn't re-polish the widget on every tick.
+    """
     def __init__(self, parent=None):
         super().__init__(parent)
         # make it click-through
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True) # needed for background-color
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
         self._background_color = QColor(0, 0, 0, 0) # start fully transparent
-        self.setStyleSheet("background-color: rgba(0,0,0,0);") # initial stylesheet
+        self._indicator_visible = False
 
     def setBackgroundColor(self, color):
-        """sets the background color and updates stylesheet."""
+        """sets the background color and schedules a repaint."""
         if self._background_color != color:
             self._background_color = color
-            self.setStyleSheet(f"background-color: {color.name(QColor.NameFormat.HexArgb)};")
             self.update() # trigger repaint
 
     def backgroundColor(self):
@@ -35,19 +101,34 @@ class OverlayWidget(QWidget):
     # define a qproperty for animation (targets the background color)
     color = pyqtProperty(QColor, fget=backgroundColor, fset=setBackgroundColor)
 
+    def setIndicatorVisible(self, visible):
+        """shows or hides the centered stop indicator."""
+        if self._indicator_visible != visible:
+            self._indicator_visible = visible
+            self.update()
+
+    def isIndicatorVisible(self):
+        return self._indicator_visible
+
     def paintEvent(self, event):
-        """overrides paintevent to ensure background is drawn if needed (though stylesheet usually handles it)."""
-        # stylesheet should handle painting, but this can be a fallback
-        # if self._background_color.alpha() > 0:
-        #     painter = QPainter(self)
-        #     painter.fillRect(self.rect(), self._background_color)
-        super().paintEvent(event) # allow default painting
+        """paints the fade color and, when stopped, the cached indicator glyph."""
+        if self._background_color.alpha() == 0 and not self._indicator_visible:
+            return
+        painter = QPainter(self)
+        if self._background_color.alpha() > 0:
+            painter.fillRect(self.rect(), self._background_color)
+        if self._indicator_visible:
+            pixmap = stop_indicator_pixmap(self.devicePixelRatioF())
+            size = pixmap.deviceIndependentSize()
+            painter.drawPixmap(QPointF((self.width() - size.width()) / 2, (self.height() - size.height()) / 2), pixmap)
+        painter.end()
 
 
 class NoSignalWidget(QWidget):
     """
     a custom pyqt6 widget that displays a retro 'no signal' tv animation
-    using embedded html/css/js in a qwebengineview. allows customization
+    using embedded html/css/js in a qwebengineview, or an equivalent qpainter
+    rendering when qtwebengine is unavailable. allows customization
     of text and colors (using predefined names or css values), and provides
     start/stop controls with fade effects.
 
@@ -60,6 +141,14 @@ class NoSignalWidget(QWidget):
     loadFinished = pyqtSignal()
     # signal emitted if the web content fails to load
     loadFailed = pyqtSignal()
+    # signal emitted with the new tier when the quality changes
+    qualityChanged = pyqtSignal(str)
+    # signal emitted with metrics() every metrics interval (see setmetricsinterval)
+    metricsUpdated = pyqtSignal(dict)
+    # signal emitted once the page has applied a start (true) or stop (false)
+    animationStateChanged = pyqtSignal(bool)
+    # signal emitted when a fade has finished; true if it faded to black
+    fadeFinished = pyqtSignal(bool)
 
     # --- predefined color names ---
     PREDEFINED_COLORS = {
@@ -112,14 +201,10 @@ class NoSignalWidget(QWidget):
     <title>No Signal Animation</title>
     <meta name="viewport" content="width=device-width, initial-scale=1">
     <style>
-        /* reset and basic styles */
-        html, body, div, span, applet, object, iframe, h1, h2, h3, h4, h5, h6, p, blockquote, pre, a, abbr, acronym, address, big, cite, code, del, dfn, em, img, ins, kbd, q, s, samp, small, strike, strong, sub, sup, tt, var, b, u, i, center, dl, dt, dd, ol, ul, li, fieldset, form, label, legend, table, caption, tbody, tfoot, thead, tr, th, td, article, aside, canvas, details, embed, figure, figcaption, footer, header, hgroup, menu, nav, output, ruby, section, summary, time, mark, audio, video {{ margin: 0; padding: 0; border: 0; font-size: 100%; font: inherit; vertical-align: baseline; }}
-        article, aside, details, figcaption, figure, footer, header, hgroup, menu, nav, section {{ display: block; }}
+        /* reset and basic styles (only the elements this page uses) */
+        html, body, main, div, span, h1 {{ margin: 0; padding: 0; border: 0; font-size: 100%; font: inherit; vertical-align: baseline; }}
+        main {{ display: block; }}
         body {{ line-height: 1; }}
-        ol, ul {{ list-style: none; }}
-        blockquote, q {{ quotes: none; }}
-        blockquote:before, blockquote:after, q:before, q:after {{ content: ""; content: none; }}
-        table {{ border-collapse: collapse; border-spacing: 0; }}
 
         /* default color variables (must match keys in default_colors) */
         :root {{
@@ -137,12 +222,8 @@ class NoSignalWidget(QWidget):
             --text-color: rgba(255, 255, 255, 1);
         }}
 
-        /* font and box sizing */
-        @font-face {{
-            font-family: "Michroma";
-            src: url("https://assets.codepen.io/1149983/Michroma-Regular.ttf") format("truetype");
-            font-weight: normal; font-style: normal; font-display: swap;
-        }}
+        /* font (inlined from the package, see assets.py) and box sizing */
+        {font_face}
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
 
         /* main layout */
@@ -206,6 +287,32 @@ class NoSignalWidget(QWidget):
         }}
         main.animation-active h1#messageText {{ /* optional: add text animation here if desired */ }}
 
+        /* quality tiers (see setquality): no backdrop blur / no shadows */
+        body.no-blur main div.message-box {{
+            backdrop-filter: none; -webkit-backdrop-filter: none; background: rgba(19, 20, 23, 0.55);
+        }}
+        body.no-shadow main div.message-box {{ box-shadow: none; }}
+        body.no-shadow main h1#messageText {{ filter: none; }}
+
+        /* in-page fade and stop indicator (fade_mode='page'); the stopped page
+           hides everything under the black layer so it stops producing frames */
+        main div.fade {{
+            display: none; position: absolute; inset: 0; z-index: 3;
+            place-items: center; background: var(--black); color: var(--white);
+            font-size: 48pt; visibility: hidden; opacity: 0;
+            transition: visibility 0s linear 0.5s, opacity 0.5s ease-in-out;
+        }}
+        body.page-fade main div.fade {{ display: grid; }}
+        body.page-fade main.stopped div.fade {{
+            visibility: visible; opacity: 1;
+            transition: visibility 0s linear 0s, opacity 0.5s ease-in-out;
+        }}
+        body.page-fade main > span, body.page-fade main div.message-box {{ transition: visibility 0s linear 0s; }}
+        body.page-fade main.stopped > span, body.page-fade main.stopped div.message-box {{
+            visibility: hidden; transition: visibility 0s linear 0.5s;
+        }}
+        body.page-fade main.no-transition, body.page-fade main.no-transition * {{ transition: none !important; }}
+
         /* keyframes for movement */
         @keyframes moveX {{ from {{ left: 0; }} to {{ left: calc(100vw - 30vw); }} }}
         @keyframes moveY {{ from {{ top: 0; }} to {{ top: calc(100vh - 10vmin); }} }}
@@ -217,6 +324,7 @@ class NoSignalWidget(QWidget):
     <span></span><span></span><span></span><span></span><span></span><span></span>
     <span></span><span></span><span></span><span></span><span></span><span></span>
     <div class="message-box"> <h1 id="messageText">{initial_text}</h1> </div>
+    <div class="fade">{stop_indicator}</div>
 </main>
 <script>
     const messageElement = document.getElementById('messageText');
@@ -232,6 +340,7 @@ class NoSignalWidget(QWidget):
         if (typeof colorMap === 'object' && colorMap !== null) {{
             for (const [key, value] of Object.entries(colorMap)) {{
                 if (key.startsWith('--')) {{ // basic validation
+                    colorTweens.delete(key); // a direct set ends a running transition
                     rootStyle.setProperty(key, value);
                     // console.debug(`js set ${{key}} to ${{value}}`);
                 }}
@@ -239,22 +348,178 @@ class NoSignalWidget(QWidget):
         }} else {{ console.error("js invalid colormap:", colorMap); }}
     }}
 
-    function startAnimation() {{
-        if (mainContainer) mainContainer.classList.add('animation-active');
+    // palette transitions: the css variables are interpolated on
+    // requestAnimationFrame from their current value to the target, so python
+    // sends each transition once instead of a color update per frame
+    const EASINGS = {{
+        'linear': t => t,
+        'ease-in': t => t * t * t,
+        'ease-out': t => 1 - Math.pow(1 - t, 3),
+        'ease-in-out': t => t < 0.5 ? 4 * t * t * t : 1 - Math.pow(2 - 2 * t, 3) / 2,
+    }};
+    const colorTweens = new Map(); // css variable -> running transition
+    let tweenFrame = null;
+
+    function parseRgba(value) {{
+        const match = /rgba?\\(([^)]*)\\)/.exec(value || '');
+        if (!match) return null;
+        const parts = match[1].split(',').map(parseFloat);
+        return parts.length >= 3 ? [parts[0], parts[1], parts[2], parts.length > 3 ? parts[3] : 1] : null;
+    }}
+
+    function transitionColors(colorMap, durationMs, easing) {{
+        const now = performance.now();
+        const computed = getComputedStyle(document.documentElement);
+        for (const [key, value] of Object.entries(colorMap)) {{
+            if (!key.startsWith('--')) continue;
+            const from = parseRgba(rootStyle.getPropertyValue(key) || computed.getPropertyValue(key));
+            const to = parseRgba(value);
+            if (!from || !to || !(durationMs > 0)) {{
+                colorTweens.delete(key);
+                rootStyle.setProperty(key, value);
+                continue;
+            }}
+            colorTweens.set(key, {{from, to, value, start: now, duration: durationMs,
+                                   ease: EASINGS[easing] || EASINGS.linear}});
+        }}
+        if (colorTweens.size && tweenFrame === null) tweenFrame = requestAnimationFrame(stepColorTweens);
+    }}
+
+    function stepColorTweens(time) {{
+        tweenFrame = null;
+        for (const [key, tween] of colorTweens) {{
+            const t = Math.min(1, Math.max(0, (time - tween.start) / tween.duration));
+            if (t >= 1) {{
+                rootStyle.setProperty(key, tween.value); // exactly the value python committed
+                colorTweens.delete(key);
+                continue;
+            }}
+            const k = tween.ease(t);
+            const [r, g, b, a] = tween.from.map((from, i) => from + (tween.to[i] - from) * k);
+            rootStyle.setProperty(key, `rgba(${{Math.round(r)}}, ${{Math.round(g)}}, ${{Math.round(b)}}, ${{a.toFixed(3)}})`);
+        }}
+        if (colorTweens.size) tweenFrame = requestAnimationFrame(stepColorTweens);
+    }}
+
+    // skips the css transitions of the next start/stop (immediate state change)
+    function skipTransitions(immediate) {{
+        if (!immediate) return;
+        mainContainer.classList.add('no-transition');
+        requestAnimationFrame(() => mainContainer.classList.remove('no-transition'));
+    }}
+
+    function startAnimation(immediate) {{
+        if (!mainContainer) return;
+        skipTransitions(immediate);
+        mainContainer.classList.remove('stopped');
+        mainContainer.classList.add('animation-active');
         console.debug("js animation started");
     }}
 
-    function stopAnimation() {{
-        if (mainContainer) mainContainer.classList.remove('animation-active');
+    function stopAnimation(immediate) {{
+        if (!mainContainer) return;
+        skipTransitions(immediate);
+        mainContainer.classList.remove('animation-active');
+        mainContainer.classList.add('stopped');
         console.debug("js animation stopped");
     }}
 
+    // true: start/stop fade to black inside the page instead of under a qt overlay
+    function setPageFade(enabled) {{
+        document.body.classList.toggle('page-fade', !!enabled);
+    }}
+
+    // quality tier from python: drops the blur and shadows, and caps the frame
+    // rate with stepped keyframes (the page only renders when the box moves)
+    function setQuality(settings) {{
+        const box = document.querySelector('main div.message-box');
+        document.body.classList.toggle('no-blur', !settings.blur);
+        document.body.classList.toggle('no-shadow', !settings.shadow);
+        if (box) box.style.animationTimingFunction = settings.fps
+            ? `steps(${{Math.max(1, Math.round(7.05 * settings.fps))}}), steps(${{Math.max(1, Math.round(7.4 * settings.fps))}})`
+            : '';
+    }}
+
+    // returns the previous frame-time sample (average interval between frames,
+    // the shortest one as the display's target, in ms, the number of intervals
+    // and the frames missed in them) and starts measuring the next count frames
+    let frameSample = null;
+    function takeFrameStats(count) {{
+        const result = frameSample && frameSample.done ? {{
+            avg: frameSample.avg, target: frameSample.target,
+            frames: frameSample.deltas.length, dropped: frameSample.dropped
+        }} : null;
+        const sample = frameSample = {{deltas: [], last: null, done: false}};
+        function tick(time) {{
+            if (sample !== frameSample) return;
+            if (sample.last !== null) sample.deltas.push(time - sample.last);
+            sample.last = time;
+            if (sample.deltas.length < count) {{ requestAnimationFrame(tick); return; }}
+            sample.avg = sample.deltas.reduce((a, b) => a + b, 0) / sample.deltas.length;
+            sample.target = Math.min(...sample.deltas);
+            sample.dropped = sample.deltas.reduce((n, d) => n + Math.max(0, Math.round(d / sample.target) - 1), 0);
+            sample.done = true;
+            if (bridge) bridge.reportFrameStats({{
+                avg: sample.avg, target: sample.target, frames: sample.deltas.length, dropped: sample.dropped
+            }});
+        }}
+        requestAnimationFrame(tick);
+        return result;
+    }}
+
+    // applies a coalesced batch of commands from python in one call (a
+    // runjavascript script, or a stateChanged message of the bridge)
+    function applyState(state) {{
+        if ('pageFade' in state) setPageFade(state.pageFade);
+        if (state.quality) setQuality(state.quality);
+        if ('text' in state) updateText(state.text);
+        if (state.colors) updateColors(state.colors);
+        if (state.transition) transitionColors(state.transition.colors, state.transition.duration, state.transition.easing);
+        if ('active' in state) {{
+            if (state.active) startAnimation(state.immediate); else stopAnimation(state.immediate);
+        }}
+        if (state.sampleFrames) takeFrameStats(state.sampleFrames);
+        if (bridge && 'seq' in state) bridge.acknowledge(state.seq, mainContainer.classList.contains('animation-active'));
+    }}
+
+    // qwebchannel bridge (see bridge.py), when python set one up: state batches
+    // arrive as stateChanged messages and the page reports back through it
+    let bridge = null;
+    if (window.qt && window.QWebChannel) {{
+        new QWebChannel(qt.webChannelTransport, channel => {{
+            bridge = channel.objects.bridge || null;
+            if (!bridge) return;
+            bridge.stateChanged.connect(applyState);
+            bridge.ready();
+        }});
+    }}
+    const fadeElement = document.querySelector('main div.fade');
+    if (fadeElement) fadeElement.addEventListener('transitionend', event => {{
+        if (event.propertyName === 'opacity' && bridge) bridge.reportFade(mainContainer.classList.contains('stopped'));
+    }});
+
     // initial state is set by python after load
 </script>
 </body>
 </html>
     """
 
+    # --- quality tiers, most to least expensive ---
+    # fps caps the message box movement (0: display rate; a low cap makes it hop),
+    # blur is the box's backdrop blur, shadow the box and text shadows
+    QUALITY_TIERS = {
+        QUALITY_FULL:     {"fps": 0,  "blur": True,  "shadow": True},
+        QUALITY_BALANCED: {"fps": 30, "blur": False, "shadow": True},
+        QUALITY_MINIMAL:  {"fps": 2,  "blur": False, "shadow": False},
+    }
+    # 'auto' quality: how often a frame-time sample is taken, and how much longer
+    # than the target frame interval the average may get
+    AUTO_QUALITY_INTERVAL_MS = 5000
+    FRAME_BUDGET_FACTOR = 1.5
+
+    # stopped widgets are frozen once the fade to black has finished (500 ms plus a margin)
+    FREEZE_DELAY_MS = 600
+
     # --- default colors (must match css :root variables) ---
     DEFAULT_COLORS = {
         "--yellow":       "rgba(245, 240, 69, 1)",
@@ -271,7 +536,8 @@ class NoSignalWidget(QWidget):
         "--text-color":   "rgba(255, 255, 255, 1)",
     }
 
-    def __init__(self, initial_text="NO SIGNAL", initial_colors=None, start_active=True, parent=None):
+    def __init__(self, initial_text="NO SIGNAL", initial_colors=None, start_active=True, parent=None,
+                 backend=BACKEND_AUTO, fade_mode=FADE_OVERLAY, quality=QUALITY_FULL, loop_file=None):
         """
         initializes the nosignalwidget.
 
@@ -283,13 +549,84 @@ class NoSignalWidget(QWidget):
             start_active (bool): if true, the animation starts automatically after loading.
                                  if false, it starts in the 'stopped' (faded black) state.
             parent (qwidget, optional): parent widget. defaults to none.
+            backend (str): 'web' renders the html page in a qwebengineview, 'native'
+                paints the same animation with qpainter (no chromium process).
+                'auto' (default) uses 'web' when qtwebengine can be imported.
+                'loop' plays a pre-rendered loop file (see loop_file).
+            fade_mode (str): 'overlay' (default) fades a qt overlay widget over the
+                view. 'page' runs the fade and the stop indicator as css transitions
+                inside the page (painted by the native view for that backend); no
+                overlay widget is created and the stopped page stops producing frames.
+            quality (str): 'full' (default), 'balanced', 'minimal' (see quality_tiers)
+                or 'auto', which starts at 'full' and lowers the tier while the
+                measured frame time is over budget.
+            loop_file (str or loop.loopfile, optional): pre-rendered loop for the
+                'loop' backend, a native view that blits the running animation
+                from the memory-mapped file (see loop.export_loop). required
+                for that backend.
         """
         super().__init__(parent)
+        self._load_clock = QElapsedTimer() # view creation -> loadfinished
+
+        if backend == BACKEND_AUTO:
+            # decided without importing qtwebengine; if it then fails to import,
+            # _create_view falls back to the native backend
+            backend = BACKEND_WEB if webengine_installed() else BACKEND_NATIVE
+        elif backend not in (BACKEND_WEB, BACKEND_NATIVE, BACKEND_LOOP):
+            raise ValueError(f"unknown backend '{backend}'. expected 'auto', 'web', 'native' or 'loop'.")
+        elif backend == BACKEND_WEB and webengine_classes() is None:
+            raise ImportError("the 'web' backend requires PyQt6-WebEngine, which could not be imported.")
+        elif backend == BACKEND_LOOP and loop_file is None:
+            raise ValueError("the 'loop' backend requires a loop_file (see loop.export_loop).")
+        self.backend = backend
+        self._loop = None
+        if backend == BACKEND_LOOP:
+            self._loop = open_loop(loop_file) if isinstance(loop_file, (str, os.PathLike)) else loop_file
+        if fade_mode not in (FADE_OVERLAY, FADE_PAGE):
+            raise ValueError(f"unknown fade mode '{fade_mode}'. expected 'overlay' or 'page'.")
+        self.fade_mode = fade_mode
+        self._check_quality(quality)
 
         self._is_page_loaded = False
+        self._pending_state = {} # coalesced page commands waiting for the next flush
+        self._flush_scheduled = False
+        self._queued_command_count = 0 # commands recorded by _call_page
+        self._flush_count = 0 # runjavascript calls actually made for them
         self._is_active = start_active # store initial desired state
         self._current_text = initial_text
         self._current_widget_colors = self.DEFAULT_COLORS.copy() # start with defaults
+        self._is_frozen = False # page lifecycle state is frozen (see _update_lifecycle)
+        self._is_parked = False # idle in a nosignalwidgetpool: frozen whatever the fade mode
+        self._watched_window = None # top-level window observed for minimization
+        self._auto_quality = quality == QUALITY_AUTO
+        self._quality = QUALITY_FULL if self._auto_quality else quality
+
+        # --- metrics (see metrics()) ---
+        self._load_ms = None
+        self._dropped_command_count = 0 # scripts refused because the page wasn't loaded
+        self._frame_stats = None # last frame-time sample
+        self._dropped_frames = 0
+        self._sampled_frames = 0
+        self._js_rtt_ms = None
+        self._js_rtt_total_ms = 0.0
+        self._js_rtt_count = 0
+        self._fade_clock = QElapsedTimer()
+        self._fade_ms = None
+        self._fade_total_ms = 0.0
+        self._fade_count = 0
+        self._is_discarded = False # page discarded by the page budget (see budget.py)
+        self._hidden_since = None # time.monotonic() of the last hide, none while shown
+        self._last_frame = None # painted in place of a discarded (or reloading) page
+        self._sequence = 0 # numbers the batches sent over the bridge
+        self._sent_at = {} # sequence -> (send time, batch had a start/stop)
+
+        # --- asyncio awaitables (see ready(), start_async(), set_text_async()) ---
+        self._ready_waiters = [] # futures resolved by the next load
+        self._fade_waiters = [] # (future, active wanted) resolved by the next finished fade
+        self._flush_waiters = [] # futures resolved once the pending state has been applied
+        self._ack_waiters = {} # bridge sequence -> futures waiting for its acknowledgement
+        self._dispatcher = post_dispatcher() # created here, on the gui thread, for post()
+        _live_widgets.add(self)
 
         # process initial_colors *before* loading html if provided
         if initial_colors:
@@ -300,75 +637,175 @@ class NoSignalWidget(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setStyleSheet("background-color: transparent;")
 
-        # --- web engine view setup ---
-        self.web_view = QWebEngineView(self)
-        self.web_page = QWebEnginePage(self)
-        self.web_view.setPage(self.web_page)
-        self.web_view.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-
-        settings = self.web_page.settings()
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.ScrollAnimatorEnabled, False)
-        self.web_page.setBackgroundColor(Qt.GlobalColor.transparent)
+        # --- render view (created by _create_view) ---
+        self.web_view = None
+        self.web_page = None
+        self._bridge = None
+        self.native_view = None
+        self._view = None
 
         # --- layout ---
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(0)
-        self.layout.addWidget(self.web_view)
         self.setLayout(self.layout)
 
-        # --- overlay for fade effect ---
-        self.overlay = OverlayWidget(self)
-        self.overlay.setGeometry(self.rect())
-        self.overlay.hide() # initially hidden
-
-        # --- animation for fade ---
-        self._fade_animation = QPropertyAnimation(self.overlay, b"color", self)
-        self._fade_animation.setDuration(500)
-        self._fade_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
-
-        # --- Stop Indicator Label ---
-        self._stop_indicator_label = QLabel("⛔️", self)
-        self._stop_indicator_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        font = QFont()
-        font.setPointSize(48) # Adjust size as needed
-        self._stop_indicator_label.setFont(font)
-        self._stop_indicator_label.setStyleSheet("color: lightgray; background-color: transparent;")
-        self._stop_indicator_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self._stop_indicator_label.hide() # Initially hidden
+        # --- overlay for fade effect (the page fades itself in 'page' mode) ---
+        self.overlay = None
+        self._fade_animation = None
+        if self.fade_mode == FADE_OVERLAY:
+            self.overlay = OverlayWidget(self)
+            self.overlay.setGeometry(self.rect())
+            self.overlay.hide() # initially hidden
+
+            # --- animation for fade ---
+            self._fade_animation = QPropertyAnimation(self.overlay, b"color", self)
+            self._fade_animation.setDuration(500)
+            self._fade_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+            self._fade_animation.finished.connect(self._on_fade_finished)
+
+            # the stop indicator is painted by the overlay (see stop_indicator_pixmap)
+
+        # in-page fade without the bridge to report its end: assumed finished after its duration
+        self._page_fade_timer = QTimer(self)
+        self._page_fade_timer.setSingleShot(True)
+        self._page_fade_timer.setInterval(STOP_FADE_MS)
+        self._page_fade_timer.timeout.connect(self._on_fade_finished)
+
+        # --- lifecycle: freeze the page while hidden, minimized or stopped ---
+        self._freeze_timer = QTimer(self)
+        self._freeze_timer.setSingleShot(True)
+        self._freeze_timer.setInterval(self.FREEZE_DELAY_MS)
+        self._freeze_timer.timeout.connect(self._update_lifecycle)
+
+        # --- 'auto' quality: periodic frame-time samples ---
+        self._quality_timer = QTimer(self)
+        self._quality_timer.setInterval(self.AUTO_QUALITY_INTERVAL_MS)
+        self._quality_timer.timeout.connect(self._sample_frame_time)
+
+        # --- periodic metricsupdated (off until setmetricsinterval) ---
+        self._metrics_timer = QTimer(self)
+        self._metrics_timer.timeout.connect(self._emit_metrics)
 
         # --- load initial content ---
-        self._load_html()
+        # the web view and its page are only created on the first showevent, so
+        # widgets that are never shown cost no chromium page; until then all
+        # state is kept in _current_text, _current_widget_colors and _is_active.
+        # the native views are cheap and created right away.
+        if self.backend != BACKEND_WEB:
+            self._create_view()
+
+    def _create_view(self):
+        """creates the render view and starts loading the content."""
+        classes = None
+        if self.backend == BACKEND_WEB:
+            classes = webengine_classes()
+            if classes is None: # 'auto' chose web, but qtwebengine doesn't import
+                print("warning: nosignalwidget: falling back to the native backend.")
+                self.backend = BACKEND_NATIVE
+                self._pending_state = {} # everything is replayed on load anyway
+        self._load_clock.start()
+
+        if self.backend == BACKEND_WEB:
+            QWebEngineView, QWebEnginePage = classes
+            self.web_view = QWebEngineView(self)
+            # page settings live on the shared profile (see engine.py)
+            self.web_page = QWebEnginePage(shared_profile(), self)
+            self.web_view.setPage(self.web_page)
+            self.web_page.setBackgroundColor(Qt.GlobalColor.transparent)
+            # typed channel to the page; without it commands go through runjavascript
+            self._bridge = attach_bridge(self.web_page)
+            if self._bridge is not None:
+                self._bridge.connected.connect(self._flush_commands)
+                self._bridge.stateApplied.connect(self._on_state_applied)
+                self._bridge.fadeFinished.connect(self._on_fade_finished)
+                self._bridge.frameStatsReported.connect(self._on_frame_stats)
+            self._view = self.web_view
+            register_page(self) # counted against the page budget
+        else:
+            if self.backend == BACKEND_LOOP:
+                self.native_view = LoopPlaybackView(self._loop, self._current_text, self._current_widget_colors, self)
+            else:
+                self.native_view = NativeNoSignalView(self._current_text, self._current_widget_colors, self)
+            self.native_view.fadeFinished.connect(self._on_fade_finished)
+            self._view = self.native_view
+        self._view.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.layout.addWidget(self._view)
+        if self.overlay is not None:
+            self.overlay.raise_() # keep the overlay above the view added after it
+
+        if self.backend == BACKEND_WEB:
+            self._load_html()
+            # --- connections ---
+            self.web_page.loadFinished.connect(self._on_load_finished)
+            # optional: connect console messages for debugging
+            # self.web_page.javaScriptConsoleMessage = self._handle_js_console_message
+        else:
+            # nothing to load; report it asynchronously like the web page does
+            QTimer.singleShot(0, lambda: self._on_load_finished(True))
 
-        # --- connections ---
-        self.web_page.loadFinished.connect(self._on_load_finished)
-        # optional: connect console messages for debugging
-        # self.web_page.javaScriptConsoleMessage = self._handle_js_console_message
+    def isViewCreated(self):
+        """returns true once the render view exists (web: after the first show)."""
+        return self._view is not None
 
     def _handle_js_console_message(self, level, message, lineNumber, sourceID):
         """(optional) prints javascript console messages to python console."""
         print(f"js console ({sourceid}:{linenumber}): {message}")
 
+    @classmethod
+    def staticPage(cls):
+        """
+        the minified page served at resource_url(page_path). it is identical
+        for every instance (text, colors and state are sent after load), so
+        the engine can keep it cached.
+        """
+        html_content = cls.HTML_TEMPLATE.format(initial_text="", font_face=font_face_css(resource_url(FONT_PATH)),
+                                                stop_indicator=STOP_INDICATOR_TEXT)
+        return _minify_html(html_content).encode("utf-8")
+
     def _load_html(self):
-        """generates and loads the html content."""
-        # use the text stored in _current_text for initial load
-        html_content = self.HTML_TEMPLATE.format(initial_text=self._current_text)
+        """loads the page content. pending commands are replayed once it has loaded."""
+        self._is_page_loaded = False
+        if is_scheme_registered():
+            self.web_view.load(QUrl(resource_url(PAGE_PATH)))
+            return
+        # the scheme could not be registered (configure_engine() wasn't called
+        # before the application was created): generate the page with the text
+        # stored in _current_text and push it through sethtml
+        global _sethtml_fallback_reported
+        if not _sethtml_fallback_reported:
+            _sethtml_fallback_reported = True
+            print("info: the nosignal:// scheme isn't registered, so every widget builds its page with setHtml. "
+                  "call configure_engine() before creating the QApplication to share one cached page.")
+        html_content = self.HTML_TEMPLATE.format(initial_text=self._current_text, font_face=font_face_css(),
+                                                 stop_indicator=STOP_INDICATOR_TEXT)
         base_url = QUrl("https://local.nosignal.widget/") # use a dummy local base url
         self.web_view.setHtml(html_content, base_url)
-        self._is_page_loaded = False
 
     def _on_load_finished(self, ok):
         """handles the web page load finished signal."""
         print(f"nosignalwidget: page load finished: {'ok' if ok else 'failed'}")
         self._is_page_loaded = ok
+        self._load_ms = self._load_clock.elapsed()
         if ok:
-            # apply the resolved initial colors stored in _current_widget_colors
-            css_colors_to_apply = self._current_widget_colors
+            # batches sent to the previous page (before a discard) are applied by the replay below
+            for waiters in self._ack_waiters.values():
+                self._flush_waiters.extend(waiters)
+            self._ack_waiters.clear()
+            # replay the current text and the resolved colors stored in _current_widget_colors
+            # (the page already has the defaults); together with the start/stop below they
+            # go out as a single script
+            if self.fade_mode == FADE_PAGE:
+                self._call_page("setPageFade", True)
+            if self._quality != QUALITY_FULL:
+                self._call_page("setQuality", self.QUALITY_TIERS[self._quality])
+            if self._auto_quality:
+                self._quality_timer.start()
+            self._call_page("updateText", self._current_text)
+            css_colors_to_apply = {key: value for key, value in self._current_widget_colors.items()
+                                   if self.DEFAULT_COLORS.get(key) != value}
             if css_colors_to_apply:
-                 colors_json = json.dumps(css_colors_to_apply)
-                 self._run_javascript(f"updateColors({colors_json});")
+                 self._call_page("updateColors", css_colors_to_apply)
 
             # set initial animation state based on _is_active flag
             if self._is_active:
@@ -377,20 +814,302 @@ class NoSignalWidget(QWidget):
             else:
                 print("nosignalwidget: setting initial state to stopped.")
                 self.stop(_immediate=True) # stop immediately without fade-out
-
+            self._flush_commands()
+            self._update_lifecycle()
+            if self.web_view is not None and self.web_view.isHidden(): # restored after a discard
+                self.web_view.show()
+                if self.overlay is not None:
+                    self.overlay.raise_()
+                self._last_frame = None
+                self.update()
+
+            _resolve(self._ready_waiters)
+            self._ready_waiters = []
             self.loadFinished.emit() # emit success signal
         else:
             print("error: nosignalwidget failed to load html content.")
+            waiters, self._ready_waiters = self._ready_waiters, []
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(RuntimeError("the no-signal page failed to load."))
             self.loadFailed.emit() # emit failure signal
 
-    def _run_javascript(self, script):
-        """safely runs javascript, checking if the page is loaded."""
+    def _run_javascript(self, script, callback=None):
+        """
+        safely runs javascript, checking if the page is loaded. the round trip
+        until the result comes back is recorded for metrics(), and the result
+        is passed to callback if given.
+        """
         if self._is_page_loaded:
-            self.web_page.runJavaScript(script)
+            started = time.perf_counter()
+
+            def on_result(result):
+                self._record_js_rtt((time.perf_counter() - started) * 1000.0)
+                if callback is not None:
+                    callback(result)
+            self.web_page.runJavaScript(script, on_result)
         else:
             # optionally queue or log warning
+            self._dropped_command_count += 1
             print("warning: attempted to run javascript before page finished loading.")
 
+    def _call_page(self, function, *args):
+        """
+        invokes one of the page control functions (updatetext, updatecolors,
+        transitioncolors, startanimation, stopanimation, setpagefade,
+        setquality) on whichever backend is in use.
+
+        the native view is called directly. for the web page the command is
+        recorded in _pending_state, collapsed with earlier ones (last text wins,
+        colors are merged, last start/stop wins) and sent as one applystate()
+        script: on load, or at the end of the current event-loop turn.
+        """
+        if self.native_view is not None:
+            getattr(self.native_view, function)(*args)
+            if function in ("startAnimation", "stopAnimation"):
+                self.animationStateChanged.emit(function == "startAnimation")
+            return
+
+        self._queued_command_count += 1
+        if function == "updateText":
+            self._pending_state["text"] = args[0]
+        elif function == "updateColors":
+            self._pending_state.setdefault("colors", {}).update(args[0])
+            transition = self._pending_state.get("transition")
+            if transition is not None: # a later direct set wins over a queued transition
+                for key in args[0]:
+                    transition["colors"].pop(key, None)
+                if not transition["colors"]:
+                    del self._pending_state["transition"]
+        elif function == "transitionColors":
+            # applied after the colors of the same batch, so it starts from them
+            transition = self._pending_state.setdefault("transition", {"colors": {}})
+            transition["colors"].update(args[0])
+            transition["duration"], transition["easing"] = args[1], args[2]
+        elif function in ("startAnimation", "stopAnimation"):
+            self._pending_state["active"] = function == "startAnimation"
+            self._pending_state["immediate"] = bool(args and args[0])
+        elif function == "setPageFade":
+            self._pending_state["pageFade"] = args[0]
+        elif function == "setQuality":
+            self._pending_state["quality"] = args[0]
+        else:
+            raise ValueError(f"unknown page function '{function}'.")
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """flushes _pending_state at the end of the current event-loop turn (once loaded)."""
+        if self._is_page_loaded and not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_commands)
+
+    def _flush_commands(self):
+        """
+        sends the coalesced pending commands to the page as one message: a
+        stateChanged emission of the bridge, or a single runjavascript call
+        if the bridge isn't available.
+        """
+        self._flush_scheduled = False
+        if not self._is_page_loaded or self._is_frozen:
+            return # kept until the page has loaded or is thawed
+        if self._bridge is not None and not self._bridge.isConnected():
+            return # flushed once the page has connected to the channel
+        waiters, self._flush_waiters = self._flush_waiters, []
+        if not self._pending_state:
+            _resolve(waiters) # nothing left to apply
+            return
+        state, self._pending_state = self._pending_state, {}
+        self._flush_count += 1
+        if self._bridge is not None:
+            self._sequence += 1
+            state["seq"] = self._sequence
+            self._sent_at[self._sequence] = (time.perf_counter(), "active" in state)
+            while len(self._sent_at) > 64: # never acknowledged (page reloaded)
+                self._sent_at.pop(next(iter(self._sent_at)))
+            if waiters:
+                self._ack_waiters[self._sequence] = waiters
+            self._bridge.pushState(state)
+        else:
+            def on_result(result):
+                if "active" in state:
+                    self.animationStateChanged.emit(state["active"])
+                _resolve(waiters)
+            self._run_javascript(f"applyState({json.dumps(state)});", on_result)
+
+    def _on_state_applied(self, sequence, active):
+        """the page acknowledged a batch sent over the bridge."""
+        for acknowledged in [seq for seq in self._ack_waiters if seq <= sequence]: # batches apply in order
+            _resolve(self._ack_waiters.pop(acknowledged))
+        sent = self._sent_at.pop(sequence, None)
+        if sent is None:
+            return
+        sent_at, had_active = sent
+        self._record_js_rtt((time.perf_counter() - sent_at) * 1000.0)
+        if had_active:
+            self.animationStateChanged.emit(active)
+
+    def isLoaded(self):
+        """returns true once the content has finished loading."""
+        return self._is_page_loaded
+
+    def isFrozen(self):
+        """returns true while the page is frozen (hidden, minimized or stopped)."""
+        return self._is_frozen
+
+    def _should_freeze(self):
+        """
+        true if nothing of the page can be seen: the widget is hidden (e.g. an
+        inactive qstackedwidget/qtabwidget page), its window is minimized, or
+        it is stopped under the black overlay. in 'page' fade mode a stopped
+        page is already idle and stays visible (it draws the black itself), so
+        it is only frozen when hidden. a widget parked in a pool is always
+        frozen.
+        """
+        if self._is_parked:
+            return True
+        window = self.window()
+        if not self.isVisible() or (window is not None and window.isMinimized()):
+            return True
+        return not self._is_active and self.overlay is not None
+
+    def _set_parked(self, parked):
+        """parks (freezes) or unparks a pooled widget; see nosignalwidgetpool."""
+        self._is_parked = parked
+        self._update_lifecycle()
+
+    def _update_lifecycle(self):
+        """
+        freezes or thaws the page (qwebenginepage.lifecyclestate) to match
+        _should_freeze(). a frozen page runs no keyframes, timers or scripts;
+        commands sent meanwhile stay in _pending_state and are flushed on
+        thaw, so no state is lost.
+        """
+        self._freeze_timer.stop()
+        if self._is_discarded:
+            if not self._should_freeze():
+                self._restore_page()
+            return
+        frozen = self._is_page_loaded and self._should_freeze()
+        if frozen == self._is_frozen:
+            return
+        self._is_frozen = frozen
+        if self.native_view is not None:
+            self.native_view.setFrozen(frozen)
+        elif frozen:
+            self.web_page.setVisible(False) # chromium refuses to freeze a visible page
+            self.web_page.setLifecycleState(self.web_page.LifecycleState.Frozen)
+        else:
+            self.web_page.setLifecycleState(self.web_page.LifecycleState.Active)
+            self.web_page.setVisible(self.web_view.isVisible())
+        if not frozen and self._pending_state and not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_commands)
+
+    # --- page budget (see budget.set_page_budget) ---
+    def hasLivePage(self):
+        """returns true if this widget has a web page that is not discarded."""
+        return self.web_page is not None and not self._is_discarded
+
+    def isDiscarded(self):
+        """returns true while the page is discarded (a cached frame is shown instead)."""
+        return self._is_discarded
+
+    def hiddenSince(self):
+        """time.monotonic() at which the widget was hidden, or none while it is shown."""
+        return self._hidden_since
+
+    def discardPage(self):
+        """
+        discards the web page (qwebenginepage.lifecyclestate.discarded) to free
+        its renderer memory; a frame rendered from the current state is shown
+        in its place. the page is reloaded and its text, colors and start/stop
+        state restored when the widget is shown again. only hidden widgets can
+        be discarded. returns true if the page was discarded.
+        """
+        if not self.hasLivePage() or self.isVisible():
+            return False
+        self._last_frame = self._render_last_frame()
+        self._is_discarded = True
+        self._is_page_loaded = False # commands queue up until the reload
+        self._is_frozen = False
+        self._freeze_timer.stop()
+        if self._bridge is not None:
+            self._bridge.reset()
+        self.web_view.hide()
+        self.web_page.setVisible(False) # chromium only discards hidden pages
+        self.web_page.setLifecycleState(self.web_page.LifecycleState.Discarded)
+        count_page_event("discards")
+        return True
+
+    def _restore_page(self):
+        """reactivates a discarded page; it reloads and _on_load_finished replays the state."""
+        self._is_discarded = False
+        self._load_clock.start()
+        self.web_page.setLifecycleState(self.web_page.LifecycleState.Active)
+        count_page_event("restores")
+        schedule_enforce() # one more live page
+
+    def snapshot(self, size=None):
+        """
+        renders a still frame of the widget's current text, colors and
+        started/stopped state to a qimage.
+
+        the frame is painted off-screen by the native renderer whatever the
+        backend (nothing is grabbed from the page, so hidden, frozen or
+        discarded widgets work too) and comes from the shared snapshot_cache,
+        so widgets with the same text, palette and size share one render.
+
+        args:
+            size (qsize or (int, int), optional): logical size of the image.
+                defaults to the widget's size (640x360 before it has one).
+        """
+        if size is None:
+            size = self.size() if not self.size().isEmpty() else QSize(640, 360)
+        width, height = (size.width(), size.height()) if isinstance(size, QSize) else map(int, size)
+        return snapshot_cache.image(self._current_text, self._current_widget_colors, width, height,
+                                    self.devicePixelRatioF(), self._is_active)
+
+    def _render_last_frame(self):
+        """renders the current state with the native painter, to stand in for the page."""
+        size = self.size() if not self.size().isEmpty() else QSize(640, 360)
+        return snapshot_cache.image(self._current_text, self._current_widget_colors, size.width(), size.height(),
+                                    self.devicePixelRatioF(), self._is_active,
+                                    self.QUALITY_TIERS[self._quality]["shadow"],
+                                    self.overlay is None) # the overlay draws the indicator otherwise
+
+    def paintEvent(self, event):
+        """paints the cached frame while the page is discarded or reloading."""
+        super().paintEvent(event)
+        if self._last_frame is not None:
+            painter = QPainter(self)
+            painter.drawImage(QRectF(self.rect()), self._last_frame)
+            painter.end()
+
+    def _watch_window(self):
+        """observes the current top-level window for minimization (it changes when reparented)."""
+        window = self.window()
+        if window is self._watched_window:
+            return
+        if self._watched_window is not None:
+            try:
+                self._watched_window.removeEventFilter(self)
+            except RuntimeError:
+                pass # already deleted
+        self._watched_window = window
+        if window is not self:
+            window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self._watched_window and event.type() == QEvent.Type.WindowStateChange:
+            self._update_lifecycle()
+        return super().eventFilter(obj, event)
+
+    def changeEvent(self, event):
+        # covers a top-level nosignalwidget being minimized
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._update_lifecycle()
+        super().changeEvent(event)
+
     @pyqtSlot(str)
     def setText(self, text):
         """
@@ -400,8 +1119,62 @@ class NoSignalWidget(QWidget):
             text (str): the text to display.
         """
         self._current_text = text
-        escaped_text = json.dumps(text)
-        self._run_javascript(f"updateText({escaped_text});")
+        self._call_page("updateText", text)
+
+    def text(self):
+        """returns the text displayed (or to be displayed) in the message box."""
+        return self._current_text
+
+    def post(self, text=None, colors=None, active=None):
+        """
+        thread-safe settext()/setcolors()/start()/stop(): may be called from
+        any thread (e.g. a decoder thread), unlike every other method.
+
+        the call is queued without touching the widget and applied on the
+        gui thread, coalesced with everything else posted to any widget
+        since the last drain: one wake-up per event-loop turn however many
+        threads post, last text wins, colors are merged, last start/stop wins.
+
+        args:
+            text (str, optional): new message text.
+            colors (dict, optional): css variable -> color value/name, as for setcolors().
+            active (bool, optional): true starts, false stops the animation.
+        """
+        update = {}
+        if text is not None:
+            update["text"] = str(text)
+        if colors:
+            update["colors"] = dict(colors)
+        if active is not None:
+            update["active"] = bool(active)
+        if update:
+            self._dispatcher.post(self, update)
+
+    def streamText(self, source):
+        """
+        shows text from a live source, such as a countdown, at no more than
+        one update per display frame.
+
+        once per frame (one timer shared by all streaming widgets) the source
+        is read and its text passed to settext() if it changed. while the
+        widget is hidden or frozen the source isn't read at all. a new
+        stream replaces the previous one; it ends when the source is
+        exhausted or stoptextstream() is called.
+
+        args:
+            source: a callable returning the current text, an iterator of
+                texts (one is taken per frame), or an async iterator, which
+                is consumed by an asyncio task (a qt-driven asyncio loop such
+                as qasync must be running) and whose latest text wins.
+        """
+        start_stream(self, source)
+
+    def stopTextStream(self):
+        """stops the text stream started by streamtext(); the last text stays."""
+        stop_stream(self)
+
+    def isStreamingText(self):
+        return is_streaming(self)
 
     @pyqtSlot(dict)
     def setColors(self, colors_dict, _update_internal_state_only=False):
@@ -414,43 +1187,287 @@ class NoSignalWidget(QWidget):
         2. predefined simple color name strings (e.g., 'bright_red', 'original_blue')
            which are keys in `nosignalwidget.predefined_colors`.
 
+        values are validated and normalized (see resolvecolor); invalid ones are
+        skipped with a warning. only variables whose resolved value actually
+        changed are sent to the page, and nothing is sent if none changed.
+
         args:
             colors_dict (dict): dictionary mapping css variable names to color values/names.
             _update_internal_state_only (bool): internal flag used during init.
         """
-        processed_colors_for_js = {}
-        updated_any_internal = False
+        changed_colors_for_js = self._commit_colors(colors_dict)
+
+        # during init only the internal state is updated; js will run on load
+        if not _update_internal_state_only and changed_colors_for_js:
+            self._call_page("updateColors", changed_colors_for_js)
+
+    @pyqtSlot(dict, int, str)
+    def transitionColors(self, colors_dict, duration_ms=500, easing="ease-in-out"):
+        """
+        animates the colors to a new palette.
 
+        the target palette is sent once and the page interpolates the css
+        variables on requestanimationframe (the native view on its frame
+        timer), instead of a setcolors() call per frame. the target is stored
+        in _current_widget_colors right away, so a reload, snapshot() or
+        discarded page shows the final palette. a setcolors() of the same
+        variable during the transition ends it there.
+
+        args:
+            colors_dict (dict): css variable -> color value/name, as for setcolors().
+            duration_ms (int): length of the transition. 0 sets the colors directly.
+            easing (str): 'linear', 'ease-in', 'ease-out' or 'ease-in-out' (cubic).
+        """
+        if easing not in EASING_CURVES:
+            raise ValueError(f"unknown easing '{easing}'. expected one of {', '.join(EASING_CURVES)}.")
+        changed_colors_for_js = self._commit_colors(colors_dict)
+        if not changed_colors_for_js:
+            return
+        if duration_ms <= 0:
+            self._call_page("updateColors", changed_colors_for_js)
+        else:
+            self._call_page("transitionColors", changed_colors_for_js, int(duration_ms), easing)
+
+    def _commit_colors(self, colors_dict):
+        """
+        validates and resolves colors_dict into _current_widget_colors and
+        returns the variables whose resolved value changed.
+        """
+        changed_colors_for_js = {}
+        for key, css_color_value in self.resolveColors(colors_dict).items():
+            if self._current_widget_colors.get(key) != css_color_value:
+                self._current_widget_colors[key] = css_color_value
+                changed_colors_for_js[key] = css_color_value
+        return changed_colors_for_js
+
+    @classmethod
+    def resolveColors(cls, colors_dict):
+        """
+        resolves every value of colors_dict (see resolvecolor) and returns the
+        valid entries. invalid keys (not a string starting with '--') and
+        invalid values are skipped with a warning. used by every api that
+        takes a colors dict, so they all apply the same rules.
+        """
+        resolved = {}
         for key, value in colors_dict.items():
             if not isinstance(key, str) or not key.startswith('--'):
                 print(f"warning: invalid color key '{key}'. must be a string starting with '--'. skipping.")
                 continue
 
-            css_color_value = None
-            if isinstance(value, str):
-                if value in self.PREDEFINED_COLORS:
-                    css_color_value = self.PREDEFINED_COLORS[value]
-                else:
-                    css_color_value = value
-            else:
-                 print(f"warning: color value for key '{key}' is not a string: {value}. skipping.")
-                 continue
+            if not isinstance(value, str):
+                print(f"warning: color value for key '{key}' is not a string: {value}. skipping.")
+                continue
+            css_color_value = cls.resolveColor(value)
+            if css_color_value is None:
+                print(f"warning: color value '{value}' for key '{key}' is not a valid css color or predefined name. skipping.")
+                continue
+            resolved[key] = css_color_value
+        return resolved
 
-            if css_color_value is not None:
-                 current_internal_value = self._current_widget_colors.get(key)
-                 if current_internal_value != css_color_value:
-                     self._current_widget_colors[key] = css_color_value
-                     updated_any_internal = True
-                 processed_colors_for_js[key] = css_color_value
+    @classmethod
+    def resolveColor(cls, value):
+        """
+        resolves a predefined color name or css color string to the normalized
+        'rgba(r, g, b, a)' form, or none if it isn't a valid color. css parsing
+        is memoized in a bounded cache (colors.normalize_css_color).
+        """
+        return normalize_css_color(cls.PREDEFINED_COLORS.get(value, value))
+
+    @staticmethod
+    def _check_quality(quality):
+        if quality != QUALITY_AUTO and quality not in NoSignalWidget.QUALITY_TIERS:
+            raise ValueError(f"unknown quality '{quality}'. expected 'full', 'balanced', 'minimal' or 'auto'.")
 
-        if not _update_internal_state_only and processed_colors_for_js:
+    @pyqtSlot(str)
+    def setQuality(self, quality):
+        """
+        sets the rendering quality tier.
+
+        args:
+            quality (str): 'full', 'balanced', 'minimal' (see quality_tiers) or
+                'auto', which keeps the current tier and lowers it whenever the
+                measured frame time goes over budget.
+        """
+        self._check_quality(quality)
+        self._auto_quality = quality == QUALITY_AUTO
+        if self._auto_quality:
             if self._is_page_loaded:
-                colors_json = json.dumps(processed_colors_for_js)
-                self._run_javascript(f"updateColors({colors_json});")
-            else:
-                print("info: setcolors called before load; changes queued.")
-        elif updated_any_internal:
-             pass # internal state updated (e.g., during init), js will run on load
+                self._quality_timer.start()
+        else:
+            self._quality_timer.stop()
+            self._apply_quality(quality)
+
+    def quality(self):
+        """returns the tier currently rendered (never 'auto'; see isautoquality)."""
+        return self._quality
+
+    def isAutoQuality(self):
+        """returns true if the tier is lowered automatically."""
+        return self._auto_quality
+
+    def _apply_quality(self, tier):
+        if tier == self._quality:
+            return
+        self._quality = tier
+        self._call_page("setQuality", self.QUALITY_TIERS[tier])
+        self.qualityChanged.emit(tier)
+
+    def _sample_frame_time(self):
+        """takes the last frame-time sample from the page (and starts the next one)."""
+        if not self._is_page_loaded or self._is_frozen or not self._is_active or not self.isVisible():
+            return # nothing is animating, so there is nothing to measure
+        if self.native_view is not None:
+            self._on_frame_stats(self.native_view.takeFrameStats())
+        elif self._bridge is not None:
+            # rides along with the next batch; a probe, not a command, so it isn't
+            # counted in queued_commands. the page reports back through the bridge
+            self._pending_state["sampleFrames"] = 30
+            self._schedule_flush()
+        else:
+            self._run_javascript("takeFrameStats(30);", self._on_frame_stats)
+
+    def _on_frame_stats(self, stats):
+        """records a frame-time sample and lowers the tier one step if frames took longer than the budget."""
+        if not stats:
+            return
+        self._frame_stats = stats
+        self._sampled_frames += stats["frames"]
+        self._dropped_frames += stats["dropped"]
+        if not self._auto_quality:
+            return
+        tiers = list(self.QUALITY_TIERS)
+        if stats["avg"] <= stats["target"] * self.FRAME_BUDGET_FACTOR or self._quality == tiers[-1]:
+            return
+        lower = tiers[tiers.index(self._quality) + 1]
+        print(f"info: nosignalwidget: average frame time {stats['avg']:.1f} ms is over budget, "
+              f"lowering quality to '{lower}'.")
+        self._apply_quality(lower)
+        if lower == tiers[-1]:
+            self._quality_timer.stop() # can't go any lower
+
+    # --- metrics ---
+    def _record_js_rtt(self, rtt_ms):
+        self._js_rtt_ms = rtt_ms
+        self._js_rtt_total_ms += rtt_ms
+        self._js_rtt_count += 1
+
+    def _on_fade_finished(self, stopped=None):
+        """
+        records how long a fade actually took (stalls included): the overlay
+        animation, or the in-page fade as reported over the bridge.
+        """
+        if stopped is None:
+            stopped = not self._is_active
+        if self.overlay is not None and not stopped:
+            self.overlay.hide() # faded out completely
+        waiters, self._fade_waiters = self._fade_waiters, []
+        for future, active in waiters:
+            if not future.done():
+                future.set_result(active != stopped)
+        if self._fade_clock.isValid():
+            self._fade_ms = self._fade_clock.elapsed()
+            self._fade_total_ms += self._fade_ms
+            self._fade_count += 1
+            self._fade_clock.invalidate()
+        self.fadeFinished.emit(stopped)
+
+    def metrics(self):
+        """
+        returns a snapshot of what this widget costs.
+
+        keys:
+            backend, fade_mode, quality, loaded, frozen, discarded, active: current state.
+            bridge: true if commands go over the qwebchannel bridge.
+            load_ms: view creation (the first show, for the web backend) to
+                loadfinished (none until loaded).
+            fps, dropped_frames, sampled_frames: from the in-page
+                requestanimationframe samples (the native view's frame timer
+                for that backend). fps is from the last sample, the frame
+                counts are totals. samples are taken while auto quality or
+                the metrics interval is on.
+            js_rtt_ms, js_rtt_avg_ms: last and mean round trip of a page
+                message (runjavascript result, or bridge acknowledgement).
+            queued_commands: commands passed to the page queue.
+            flushed_scripts: page messages they were coalesced into.
+            pending_commands: batched state waiting for the next flush.
+            dropped_commands: scripts refused because the page wasn't loaded.
+            fade_count, last_fade_ms, avg_fade_ms: completed fades and their
+                real duration (overlay fades, and in-page fades reported over
+                the bridge).
+        """
+        stats = self._frame_stats
+        return {
+            "backend": self.backend,
+            "fade_mode": self.fade_mode,
+            "quality": self._quality,
+            "loaded": self._is_page_loaded,
+            "frozen": self._is_frozen,
+            "active": self._is_active,
+            "bridge": self._bridge is not None and self._bridge.isConnected(),
+            "discarded": self._is_discarded,
+            "load_ms": self._load_ms,
+            "fps": 1000.0 / stats["avg"] if stats and stats["avg"] > 0 else None,
+            "dropped_frames": self._dropped_frames,
+            "sampled_frames": self._sampled_frames,
+            "js_rtt_ms": self._js_rtt_ms,
+            "js_rtt_avg_ms": self._js_rtt_total_ms / self._js_rtt_count if self._js_rtt_count else None,
+            "queued_commands": self._queued_command_count,
+            "flushed_scripts": self._flush_count,
+            "pending_commands": len(self._pending_state),
+            "dropped_commands": self._dropped_command_count,
+            "fade_count": self._fade_count,
+            "last_fade_ms": self._fade_ms,
+            "avg_fade_ms": self._fade_total_ms / self._fade_count if self._fade_count else None,
+        }
+
+    def setMetricsInterval(self, interval_ms):
+        """
+        emits metricsupdated every interval_ms milliseconds (0 turns it off,
+        the default). each tick also starts a new frame-time sample.
+        """
+        if interval_ms > 0:
+            self._metrics_timer.start(interval_ms)
+        else:
+            self._metrics_timer.stop()
+
+    def metricsInterval(self):
+        return self._metrics_timer.interval() if self._metrics_timer.isActive() else 0
+
+    def _emit_metrics(self):
+        self._sample_frame_time()
+        self.metricsUpdated.emit(self.metrics())
+
+    @classmethod
+    def aggregateMetrics(cls):
+        """
+        metrics summed (counters) and averaged (timings) over every live
+        nosignalwidget, as one flat dict (e.g. for a prometheus exporter).
+        """
+        widgets = [widget.metrics() for widget in list(_live_widgets) if not sip.isdeleted(widget)]
+
+        def mean(key):
+            values = [m[key] for m in widgets if m[key] is not None]
+            return sum(values) / len(values) if values else None
+
+        def count(key, value=True):
+            return sum(1 for m in widgets if m[key] == value)
+
+        return {
+            "instances": len(widgets),
+            "loaded": count("loaded"),
+            "frozen": count("frozen"),
+            "active": count("active"),
+            "bridge": count("bridge"),
+            "discarded": count("discarded"),
+            "web_backend": count("backend", BACKEND_WEB),
+            "native_backend": count("backend", BACKEND_NATIVE),
+            "loop_backend": count("backend", BACKEND_LOOP),
+            **{f"quality_{tier}": count("quality", tier) for tier in cls.QUALITY_TIERS},
+            **{key: sum(m[key] for m in widgets) for key in (
+                "dropped_frames", "sampled_frames", "queued_commands", "flushed_scripts",
+                "pending_commands", "dropped_commands", "fade_count")},
+            **{f"avg_{key}": mean(key) for key in ("load_ms", "fps", "js_rtt_ms", "last_fade_ms")},
+        }
 
     @pyqtSlot()
     def start(self, _immediate=False):
@@ -460,7 +1477,13 @@ class NoSignalWidget(QWidget):
         """
         if not self._is_active or _immediate: # allow immediate start even if already active
             self._is_active = True
-            self._run_javascript("startAnimation();")
+            self._update_lifecycle() # thaw before the start command is flushed
+            self._call_page("startAnimation", _immediate)
+            if self.overlay is None:
+                if not _immediate:
+                    self._fade_clock.start()
+                    self._start_page_fade_timer()
+                return # the page fades itself
 
             # fade out the overlay
             self.overlay.show()
@@ -478,12 +1501,11 @@ class NoSignalWidget(QWidget):
                 self._fade_animation.setStartValue(self.overlay.backgroundColor())
                 self._fade_animation.setEndValue(QColor(0, 0, 0, 0))
                 self._fade_animation.start()
-                # hide overlay after animation finishes if still active
-                QTimer.singleShot(self._fade_animation.duration() + 50, # add slight delay
-                                  lambda: self.overlay.hide() if self._is_active else None)
+                self._fade_clock.start() # for metrics(), see _on_fade_finished
+                # the overlay is hidden by _on_fade_finished once the animation has finished
 
             # Hide stop indicator when starting
-            self._stop_indicator_label.hide()
+            self.overlay.setIndicatorVisible(False)
 
     @pyqtSlot()
     def stop(self, _immediate=False):
@@ -493,7 +1515,14 @@ class NoSignalWidget(QWidget):
         """
         if self._is_active or _immediate: # allow immediate stop even if already stopped
             self._is_active = False
-            self._run_javascript("stopAnimation();")
+            self._call_page("stopAnimation", _immediate)
+            if self._is_page_loaded:
+                self._freeze_timer.start() # freeze once the fade has finished
+            if self.overlay is None:
+                if not _immediate:
+                    self._fade_clock.start()
+                    self._start_page_fade_timer()
+                return # the page fades itself
 
             # fade in the overlay
             self.overlay.show()
@@ -512,38 +1541,112 @@ class NoSignalWidget(QWidget):
                 self._fade_animation.setStartValue(self.overlay.backgroundColor())
                 self._fade_animation.setEndValue(QColor(0, 0, 0, 255))
                 self._fade_animation.start()
+                self._fade_clock.start() # for metrics(), see _on_fade_finished
 
-            # Show and raise stop indicator when stopping
-            self._update_stop_indicator_geometry()
-            self._stop_indicator_label.show()
-            self._stop_indicator_label.raise_()
+            # Show stop indicator when stopping
+            self.overlay.setIndicatorVisible(True)
 
-    def _update_stop_indicator_geometry(self):
-        """Updates the geometry of the stop indicator label to match the widget."""
-        self._stop_indicator_label.setGeometry(self.rect())
+    def _start_page_fade_timer(self):
+        """stands in for the page's fade report when there is no bridge to send it."""
+        if self.web_page is not None and self._bridge is None:
+            self._page_fade_timer.start()
+
+    # --- asyncio awaitables (e.g. under qasync); they must be awaited on the gui thread ---
+    async def ready(self):
+        """
+        waits until the content has loaded (returns at once if it has). the
+        web backend only loads once the widget is first shown. raises
+        runtimeerror if the page fails to load.
+        """
+        if self._is_page_loaded:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._ready_waiters.append(future)
+        await future
+
+    async def _transition_async(self, action, active):
+        """runs start or stop and waits for its fade; true if it ended in the wanted state."""
+        if self._is_active == active or not self.isVisible():
+            action() # no fade to wait for (already there, or nothing is shown)
+            return self._is_active == active
+        if not self._is_page_loaded:
+            action() # applied without a fade on load
+            await self.ready()
+            return self._is_active == active
+        future = asyncio.get_running_loop().create_future()
+        self._fade_waiters.append((future, active))
+        action()
+        return await future
+
+    async def start_async(self):
+        """
+        start() that completes when the fade-in has really finished (the
+        overlay animation, or the page's own fade). returns false if a stop()
+        reversed it before it finished. a hidden widget returns at once.
+        """
+        return await self._transition_async(self.start, True)
+
+    async def stop_async(self):
+        """stop() that completes when the fade to black has finished (see start_async)."""
+        return await self._transition_async(self.stop, False)
+
+    async def set_text_async(self, text):
+        """
+        settext() that completes once the page has applied the text: on the
+        bridge acknowledgement, or the runjavascript result without the
+        bridge. the native views apply it at once. text set before the page
+        has loaded (or while it's frozen) completes when it's applied.
+        """
+        self.setText(text)
+        if self.native_view is not None:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._flush_waiters.append(future)
+        await future
 
     def resizeEvent(self, event):
-        """ensure overlay covers the widget on resize."""
-        self.overlay.setGeometry(self.rect())
-        self._update_stop_indicator_geometry() # Keep indicator centered
+        """ensure overlay (and the indicator it centers) covers the widget on resize."""
+        if self.overlay is not None:
+            self.overlay.setGeometry(self.rect())
         super().resizeEvent(event)
 
     def showEvent(self, event):
         """ensure overlay state is correct when widget is shown."""
-        if not self._is_active:
+        self._hidden_since = None
+        if self._view is None:
+            self._create_view() # deferred until the widget is first shown
+        if self.overlay is None:
+            pass # the page keeps its own fade state
+        elif not self._is_active:
              # if meant to be stopped, ensure overlay is fully opaque black
              self.overlay.setBackgroundColor(QColor(0, 0, 0, 255))
              self.overlay.show()
              self.overlay.raise_()
-             # Also show and raise indicator if stopped
-             self._update_stop_indicator_geometry()
-             self._stop_indicator_label.show()
-             self._stop_indicator_label.raise_()
+             # Also show indicator if stopped
+             self.overlay.setIndicatorVisible(True)
         else:
              # if meant to be active, ensure overlay is hidden
              self.overlay.hide()
-             self._stop_indicator_label.hide()
+             self.overlay.setIndicatorVisible(False)
         super().showEvent(event)
+        self._watch_window()
+        self._update_lifecycle()
+
+    def hideEvent(self, event):
+        """freezes the page while the widget is hidden (and makes it a discard candidate)."""
+        super().hideEvent(event)
+        self._hidden_since = time.monotonic()
+        self._update_lifecycle()
+        schedule_enforce()
+
+# resources for the custom scheme. the scheme itself has to be registered
+# before the qapplication exists; that needs qtwebengine, which this package
+# doesn't import on its own, so it happens in configure_engine() or here if
+# the application has already imported qtwebengine
+add_resource(PAGE_PATH, b"text/html", NoSignalWidget.staticPage)
+add_resource(FONT_PATH, b"font/ttf", lambda: asset_bytes(FONT_FILE) or b"")
+if "PyQt6.QtWebEngineCore" in sys.modules:
+    register_scheme()
 
 # minimal self-run test (better testing in nosignalexamplewindow.py)
 if __name__ == "__main__":
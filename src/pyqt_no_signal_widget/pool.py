@@ -0,0 +1,165 @@
+# pool.py
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+from .no_signal_widget import NoSignalWidget, BACKEND_AUTO, FADE_OVERLAY
+
+
+class NoSignalWidgetPool(QObject):
+    """
+    keeps a number of nosignalwidgets created and loaded ahead of time so a
+    placeholder can be swapped in without waiting for the page to load.
+
+    idle widgets live in a hidden holder window that is 'shown' without
+    appearing on screen (wa_dontshowonscreen), so their pages load while
+    waiting. they are parked stopped, which freezes their pages, so idle
+    widgets run no animation; acquire() applies the state and restarts them.
+
+    usage:
+        pool = NoSignalWidgetPool(size=4)
+        pool.warmup() # at application start-up
+        ...
+        placeholder = pool.acquire(layout=feed_layout, text="CAMERA 3 LOST")
+        ...
+        pool.release(placeholder)
+    """
+
+    # emitted once every idle widget in the pool has finished loading
+    warmedUp = pyqtSignal()
+
+    def __init__(self, size=4, backend=BACKEND_AUTO, parent=None, fade_mode=FADE_OVERLAY):
+        """
+        args:
+            size (int): number of idle, pre-loaded widgets to keep.
+            backend (str): backend passed to every pooled nosignalwidget.
+            parent (qobject, optional): parent object. defaults to none.
+            fade_mode (str): fade mode passed to every pooled nosignalwidget.
+        """
+        super().__init__(parent)
+        self._size = max(0, int(size))
+        self._backend = backend
+        self._fade_mode = fade_mode
+        self._idle = [] # pooled widgets, loaded or still loading
+        self._warmed_up = False
+
+        self._holder = QWidget()
+        self._holder.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen, True)
+        self._holder.resize(640, 360)
+        self.destroyed.connect(self._holder.deleteLater)
+
+    def size(self):
+        """the number of idle widgets the pool tries to keep."""
+        return self._size
+
+    def idleCount(self):
+        """number of widgets currently waiting in the pool."""
+        return len(self._idle)
+
+    def readyCount(self):
+        """number of idle widgets whose content has finished loading."""
+        return sum(1 for widget in self._idle if widget.isLoaded())
+
+    def warmup(self):
+        """
+        creates the pooled widgets, which also starts the web engine.
+        call this at application start-up, after the qapplication exists.
+        """
+        self._holder.show()
+        while len(self._idle) < self._size:
+            self._idle.append(self._create_widget())
+        self._check_warmed_up()
+        return self
+
+    def acquire(self, text="NO SIGNAL", colors=None, start_active=True, parent=None, layout=None):
+        """
+        takes a widget out of the pool and applies the requested state in place.
+
+        args:
+            text (str): text to show.
+            colors (dict, optional): colors on top of default_colors.
+            start_active (bool): start the animation (true) or show the stopped state.
+            parent (qwidget, optional): new parent widget.
+            layout (qlayout, optional): layout to add the widget to; its
+                parent widget is used when parent is not given.
+
+        returns:
+            nosignalwidget: a widget, already loaded unless the pool ran dry.
+        """
+        # prefer a widget that has finished loading
+        widget = next((w for w in self._idle if w.isLoaded()), None)
+        if widget is not None:
+            self._idle.remove(widget)
+        elif self._idle:
+            widget = self._idle.pop(0)
+        else:
+            print("info: nosignalwidgetpool is empty; creating a widget on demand.")
+            widget = self._create_widget()
+
+        widget._set_parked(False)
+        widget.setText(text)
+        palette = NoSignalWidget.DEFAULT_COLORS.copy()
+        palette.update(colors or {})
+        widget.setColors(palette)
+        if start_active:
+            widget.start(_immediate=True)
+        else:
+            widget.stop(_immediate=True)
+
+        if parent is None and layout is not None:
+            parent = layout.parentWidget()
+        widget.setParent(parent)
+        if layout is not None:
+            layout.addWidget(widget)
+        widget.show()
+
+        QTimer.singleShot(0, self._refill)
+        return widget
+
+    def release(self, widget):
+        """
+        returns a widget obtained from acquire() to the pool. surplus widgets
+        are deleted.
+        """
+        if widget in self._idle:
+            return
+        parent = widget.parentWidget()
+        if parent is not None and parent.layout() is not None:
+            parent.layout().removeWidget(widget)
+
+        if len(self._idle) >= self._size:
+            widget.setParent(None)
+            widget.deleteLater()
+            return
+        widget.stop(_immediate=True)
+        widget.setParent(self._holder)
+        widget.setGeometry(self._holder.rect())
+        widget.show()
+        widget._set_parked(True) # no animation while idle
+        self._idle.append(widget)
+
+    def clear(self):
+        """deletes all idle widgets."""
+        for widget in self._idle:
+            widget.deleteLater()
+        self._idle = []
+
+    def _create_widget(self):
+        widget = NoSignalWidget(start_active=False, backend=self._backend, parent=self._holder,
+                                fade_mode=self._fade_mode)
+        widget.setGeometry(self._holder.rect())
+        widget.loadFinished.connect(self._check_warmed_up)
+        widget.show()
+        widget._set_parked(True) # frozen once its page has loaded
+        return widget
+
+    def _refill(self):
+        """tops the pool back up after widgets were handed out."""
+        if not self._holder.isVisible():
+            return # not warmed up yet; warmup() fills the pool
+        while len(self._idle) < self._size:
+            self._idle.append(self._create_widget())
+
+    def _check_warmed_up(self):
+        if not self._warmed_up and len(self._idle) >= self._size and self.readyCount() >= self._size:
+            self._warmed_up = True
+            self.warmedUp.emit()
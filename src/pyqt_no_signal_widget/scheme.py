@@ -0,0 +1,95 @@
+# scheme.py
+
+from PyQt6.QtCore import QCoreApplication, QBuffer, QIODevice
+
+# custom url scheme the static widget documents are served from
+SCHEME_NAME = b"nosignal"
+SCHEME_HOST = "widget"
+
+# path -> (mime type, bytes or a callable returning bytes)
+_resources = {}
+_handler = None
+
+
+def resource_url(path):
+    """absolute url of a resource served by the scheme handler."""
+    return f"{SCHEME_NAME.decode()}://{SCHEME_HOST}/{path.lstrip('/')}"
+
+
+def add_resource(path, mime_type, data):
+    """
+    makes a resource available under resource_url(path).
+
+    args:
+        path (str): resource path, e.g. 'index.html'.
+        mime_type (bytes): content type, e.g. b'text/html'.
+        data (bytes or callable): the content, or a callable producing it on
+            first request (the result is kept).
+    """
+    _resources["/" + path.lstrip("/")] = (mime_type, data)
+
+
+def register_scheme():
+    """
+    registers the custom scheme with qtwebengine.
+
+    chromium only accepts scheme registrations before the qapplication is
+    created, so this is called when the package is imported (if no
+    application exists yet) and by configure_engine(). returns true if the
+    scheme is usable.
+    """
+    from PyQt6.QtWebEngineCore import QWebEngineUrlScheme
+
+    if is_scheme_registered():
+        return True
+    if QCoreApplication.instance() is not None:
+        return False # too late; pages fall back to sethtml
+    scheme = QWebEngineUrlScheme(SCHEME_NAME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setDefaultPort(QWebEngineUrlScheme.SpecialPort.PortUnspecified)
+    scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme |
+                    QWebEngineUrlScheme.Flag.LocalAccessAllowed |
+                    QWebEngineUrlScheme.Flag.CorsEnabled)
+    QWebEngineUrlScheme.registerScheme(scheme)
+    return True
+
+
+def is_scheme_registered():
+    """true if register_scheme() succeeded before the application started."""
+    from PyQt6.QtWebEngineCore import QWebEngineUrlScheme
+    return bytes(QWebEngineUrlScheme.schemeByName(SCHEME_NAME).name()) == SCHEME_NAME
+
+
+def install_scheme_handler(profile):
+    """installs the (single, shared) resource handler on a web engine profile."""
+    global _handler
+    if not is_scheme_registered():
+        return False
+    if _handler is None:
+        _handler = _make_handler()
+    profile.installUrlSchemeHandler(SCHEME_NAME, _handler)
+    return True
+
+
+def _make_handler():
+    from PyQt6.QtWebEngineCore import QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob
+
+    class NoSignalSchemeHandler(QWebEngineUrlSchemeHandler):
+        """serves the registered static resources from memory."""
+
+        def requestStarted(self, job):
+            url = job.requestUrl()
+            entry = _resources.get(url.path()) if url.host() == SCHEME_HOST else None
+            if entry is None:
+                job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+                return
+            mime_type, data = entry
+            if callable(data):
+                data = data()
+                _resources[url.path()] = (mime_type, data)
+            buffer = QBuffer(job) # owned by the job, freed with it
+            buffer.setData(data)
+            buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            job.reply(mime_type, buffer)
+
+    return NoSignalSchemeHandler(QCoreApplication.instance())
@@ -0,0 +1,116 @@
+# snapshot.py
+
+from PyQt6.QtCore import Qt, QSize, QRectF, QBuffer, QIODevice
+from PyQt6.QtGui import QImage, QPainter
+from .native_view import paint_color_bars, paint_message_box, paint_stop_indicator
+from .assets import register_native_font
+from .lru import LruCache
+
+DEFAULT_SNAPSHOT_SIZE = QSize(320, 180)
+
+
+class SnapshotCache(LruCache):
+    """
+    bounded lru cache of rendered still frames.
+
+    keyed by (text, resolved palette, size, device pixel ratio, state), so a
+    list of hundreds of thumbnails costs one render per distinct key. the
+    images are implicitly shared; painting on a returned image detaches it
+    and leaves the cached copy untouched.
+    """
+
+    def __init__(self, max_entries=64):
+        super().__init__(max_entries)
+
+    @staticmethod
+    def key(text, colors, width, height, device_pixel_ratio, active, shadow, indicator):
+        """cache key; colors are the resolved css values, so 'red' and '#ff0000' share an entry."""
+        return (text, tuple(sorted(colors.items())), width, height, device_pixel_ratio, active, shadow, indicator)
+
+    def image(self, text, colors, width, height, device_pixel_ratio=1.0, active=True, shadow=True, indicator=True):
+        """returns the frame for the given logical size, rendering it on a miss."""
+        key = self.key(text, colors, width, height, device_pixel_ratio, active, shadow, indicator)
+        return self.get(key, lambda: render_frame_image(text, colors, width, height, device_pixel_ratio,
+                                                        active, shadow, indicator))
+
+
+# shared by snapshot(), render_no_signal_image() and discarded pages
+snapshot_cache = SnapshotCache()
+
+
+def render_frame_image(text, colors, width, height, device_pixel_ratio=1.0, active=True, shadow=True, indicator=True):
+    """
+    paints one still frame off-screen with the native painter (uncached).
+
+    args:
+        text (str): message text.
+        colors (dict): resolved css variable -> css color string.
+        width (int), height (int): logical size.
+        device_pixel_ratio (float): the image holds width*ratio x height*ratio pixels.
+        active (bool): the running frame (bars and message box) or the stopped one (black).
+        shadow (bool): draw the text drop shadow.
+        indicator (bool): draw the stop indicator on the stopped frame.
+    """
+    register_native_font()
+    image = QImage(max(1, round(width * device_pixel_ratio)), max(1, round(height * device_pixel_ratio)),
+                   QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(device_pixel_ratio)
+    image.fill(Qt.GlobalColor.black)
+    painter = QPainter(image)
+    rect = QRectF(0, 0, width, height)
+    if active:
+        paint_color_bars(painter, rect, colors)
+        paint_message_box(painter, rect, colors, text, 0, 1.0, shadow)
+    elif indicator:
+        paint_stop_indicator(painter, rect)
+    painter.end()
+    return image
+
+
+def resolve_palette(colors):
+    """the widget's default palette with colors (names or css strings) resolved on top."""
+    from .no_signal_widget import NoSignalWidget # imported late: no_signal_widget uses this module
+    palette = NoSignalWidget.DEFAULT_COLORS.copy()
+    palette.update(NoSignalWidget.resolveColors(colors or {}))
+    return palette
+
+
+def _logical_size(size):
+    if size is None:
+        return DEFAULT_SNAPSHOT_SIZE.width(), DEFAULT_SNAPSHOT_SIZE.height()
+    if isinstance(size, QSize):
+        return size.width(), size.height()
+    width, height = size
+    return int(width), int(height)
+
+
+def render_no_signal_image(text="NO SIGNAL", colors=None, size=None, device_pixel_ratio=1.0, active=True):
+    """
+    renders a still no-signal frame to a qimage without creating a widget.
+
+    the frame is painted off-screen by the native renderer (no qtwebengine
+    page) and cached in snapshot_cache, so repeated calls with the same text,
+    resolved palette, size and ratio return the same image. a
+    qguiapplication must exist (fonts).
+
+    args:
+        text (str): message text.
+        colors (dict, optional): css variable -> color value or predefined
+            name (see nosignalwidget.setcolors), applied over the defaults.
+        size (qsize or (int, int), optional): logical size, 320x180 by default.
+        device_pixel_ratio (float): pixel density of the image.
+        active (bool): the running frame; false renders the stopped frame.
+
+    returns:
+        qimage: the rendered frame. save it with image.save('card.png').
+    """
+    width, height = _logical_size(size)
+    return snapshot_cache.image(text, resolve_palette(colors), width, height, device_pixel_ratio, active)
+
+
+def image_to_png(image):
+    """encodes a qimage as png bytes (e.g. for an email attachment)."""
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
@@ -0,0 +1,117 @@
+# textstream.py
+
+import asyncio
+import weakref
+from PyQt6 import sip
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QGuiApplication
+
+DEFAULT_FRAME_INTERVAL_MS = 16 # when the screen doesn't report a refresh rate
+
+_streams = weakref.WeakKeyDictionary() # nosignalwidget -> textstream
+_ticker = None # one timer for every streaming widget
+
+
+class TextStream:
+    """
+    a widget's source of text updates: a callable polled once per frame, an
+    iterator advanced once per frame, or an async iterator consumed by an
+    asyncio task whose latest value is taken once per frame.
+    """
+
+    def __init__(self, source):
+        if isinstance(source, (str, bytes)):
+            raise TypeError("a text stream needs a callable, an iterator or an async iterator, not a string.")
+        self._latest = None # async: newest text not yet taken
+        self._finished = False
+        self._poll = None
+        self._task = None
+        if hasattr(source, "__aiter__"):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise RuntimeError("streaming from an async iterator needs a running asyncio event loop "
+                                   "driven by qt (e.g. qasync).") from None
+            self._task = loop.create_task(self._consume(source))
+        elif callable(source):
+            self._poll = source
+        else:
+            iterator = iter(source) # raises typeerror for anything else
+            self._poll = lambda: next(iterator)
+
+    async def _consume(self, source):
+        try:
+            async for text in source:
+                self._latest = text # only the newest value is kept
+        except Exception as e:
+            print(f"warning: text stream failed: {e}")
+        finally:
+            self._finished = True
+
+    def take(self):
+        """
+        returns (text, finished): the next text (none if there is nothing new)
+        and whether the source is exhausted.
+        """
+        if self._task is not None:
+            text, self._latest = self._latest, None
+            return text, self._finished and text is None
+        try:
+            return self._poll(), False
+        except StopIteration:
+            return None, True
+        except Exception as e:
+            print(f"warning: text stream failed: {e}")
+            return None, True
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
+
+
+def frame_interval_ms():
+    """one frame of the primary screen, in milliseconds."""
+    screen = QGuiApplication.primaryScreen()
+    rate = screen.refreshRate() if screen is not None else 0
+    return max(1, round(1000.0 / rate)) if rate > 0 else DEFAULT_FRAME_INTERVAL_MS
+
+
+def start_stream(widget, source):
+    """replaces the widget's text stream with one reading from source."""
+    global _ticker
+    stream = TextStream(source) # validate before dropping the old one
+    stop_stream(widget)
+    _streams[widget] = stream
+    if _ticker is None:
+        _ticker = QTimer()
+        _ticker.timeout.connect(_tick)
+    if not _ticker.isActive():
+        _ticker.start(frame_interval_ms())
+
+
+def stop_stream(widget):
+    """stops the widget's text stream, if any."""
+    stream = _streams.pop(widget, None)
+    if stream is not None:
+        stream.close()
+
+
+def is_streaming(widget):
+    return widget in _streams
+
+
+def _tick():
+    """delivers at most one text per widget per frame (skipping hidden, frozen and unchanged)."""
+    for widget, stream in list(_streams.items()):
+        if sip.isdeleted(widget):
+            stop_stream(widget)
+            continue
+        if not widget.isVisible() or widget.isFrozen():
+            continue # the source isn't read; the newest async value waits
+        text, finished = stream.take()
+        if text is not None and text != widget.text():
+            widget.setText(str(text))
+        if finished:
+            stop_stream(widget)
+    if not _streams:
+        _ticker.stop()
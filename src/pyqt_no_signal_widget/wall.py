@@ -0,0 +1,411 @@
+# wall.py
+
+import json
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer, QRectF, QUrl, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter
+from .no_signal_widget import NoSignalWidget, BACKEND_AUTO, BACKEND_WEB, BACKEND_NATIVE
+from .native_view import (paint_cached_color_bars, paint_message_box, paint_stop_indicator, FRAME_INTERVAL_MS,
+                          BOX_FADE_MS)
+from .engine import shared_profile, webengine_classes
+from .assets import font_face_css, register_native_font
+
+FADE_MS = 500 # same duration as the nosignalwidget overlay fade
+
+# --- html/css/js template for the wall ---
+# each tile is a <main> with the same span grid and message-box markup as
+# nosignalwidget.html_template. viewport units are replaced by --vmin, which
+# a resizeobserver keeps at 1% of the tile's shorter side.
+WALL_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>No Signal Wall</title>
+    <style>
+        :root {{
+{root_colors}
+        }}
+        {font_face}
+        * {{ margin: 0; padding: 0; border: 0; box-sizing: border-box; }}
+        body {{
+            overflow: hidden; background-color: rgba(0, 0, 0, 1); line-height: 1;
+            display: grid; height: 100vh; width: 100vw; gap: {spacing}px;
+            grid-template-columns: repeat({columns}, 1fr); grid-template-rows: repeat({rows}, 1fr);
+        }}
+        main {{
+            --vmin: 1px;
+            display: grid; grid-template-columns: repeat(6, 1fr);
+            grid-template-rows: 4fr 1fr 1fr; place-items: center;
+            grid-auto-flow: column dense; height: 100%; width: 100%;
+            position: relative; overflow: hidden; background-color: var(--black);
+        }}
+        main span {{
+            z-index: 1; display: flex; flex-flow: column wrap;
+            height: 100%; width: 100%; filter: brightness(0.95);
+        }}
+        main span:nth-child(-n+6) {{ grid-row: 1; }}
+        main span:nth-of-type(1) {{ background-color: var(--yellow); }}
+        main span:nth-of-type(2) {{ background-color: var(--light-blue); }}
+        main span:nth-of-type(3) {{ background-color: var(--green); }}
+        main span:nth-of-type(4) {{ background-color: var(--purple); }}
+        main span:nth-of-type(5) {{ background-color: var(--red); }}
+        main span:nth-of-type(6) {{ background-color: var(--blue); }}
+        main span:nth-child(n+7) {{ grid-row: 2; }}
+        main span:nth-of-type(7) {{ background-color: var(--blue); }}
+        main span:nth-of-type(8) {{ background-color: var(--purple); }}
+        main span:nth-of-type(9) {{ background-color: var(--black); }}
+        main span:nth-of-type(10) {{ background-color: var(--light-blue); }}
+        main span:nth-of-type(11) {{ background-color: var(--black); }}
+        main span:nth-of-type(12) {{ background-color: var(--white); }}
+        main span:nth-child(n+13) {{ grid-row: 3; }}
+        main span:nth-of-type(13) {{ background-color: var(--navy); }}
+        main span:nth-of-type(14) {{ background-color: var(--white); }}
+        main span:nth-of-type(15) {{ background-color: var(--dark-purple); }}
+        main span:nth-of-type(16) {{ background-color: var(--black); }}
+        main span:nth-of-type(17) {{ background-color: var(--gray); }}
+        main span:nth-of-type(18) {{ background-color: var(--black); }}
+
+        main div.message-box {{
+            display: inline-grid; place-items: center; left: 0; top: 0;
+            z-index: 2; position: absolute; width: 30%;
+            background: rgba(19, 20, 23, 0.35); box-shadow: 0 8px 32px 0 rgba(19, 20, 23, 0.35);
+            backdrop-filter: blur(15px); -webkit-backdrop-filter: blur(15px);
+            border-radius: 10px; border: 1px solid rgba(255, 255, 255, 0.18);
+            visibility: hidden; opacity: 0;
+            transition: visibility 0s linear 0.3s, opacity 0.3s ease-in-out;
+        }}
+        main.animation-active div.message-box {{
+            animation: moveX 7.05s linear 0s infinite alternate, moveY 7.4s linear 0s infinite alternate;
+            visibility: visible; opacity: 1;
+            transition: visibility 0s linear 0s, opacity 0.3s ease-in-out;
+        }}
+        main h1 {{
+            font-family: "Michroma", sans-serif; padding: calc(3 * var(--vmin)) var(--vmin);
+            font-size: calc(3.5 * var(--vmin));
+            text-transform: uppercase; color: var(--text-color);
+            filter: drop-shadow(5px 5px 8px var(--black)); text-align: center;
+            word-wrap: break-word;
+        }}
+
+        /* fade-to-black and stop indicator, done in-page instead of a qt overlay */
+        main div.fade {{
+            position: absolute; inset: 0; z-index: 3; display: grid; place-items: center;
+            background-color: rgba(0, 0, 0, 1); color: lightgray; font-size: calc(12 * var(--vmin));
+            opacity: 0; visibility: hidden;
+            transition: opacity {fade_ms}ms ease-in-out, visibility 0s linear {fade_ms}ms;
+        }}
+        main.stopped div.fade {{
+            opacity: 1; visibility: visible;
+            transition: opacity {fade_ms}ms ease-in-out, visibility 0s linear 0s;
+        }}
+        main.no-transition div.fade, main.no-transition div.message-box {{ transition: none; }}
+
+        @keyframes moveX {{ from {{ left: 0; }} to {{ left: 70%; }} }}
+        @keyframes moveY {{ from {{ top: 0; }} to {{ top: calc(100% - 10 * var(--vmin)); }} }}
+    </style>
+</head>
+<body>
+{tiles}
+<script>
+    const tiles = Array.from(document.querySelectorAll('main'));
+
+    const resizeObserver = new ResizeObserver(entries => {{
+        for (const entry of entries) {{
+            const rect = entry.contentRect;
+            entry.target.style.setProperty('--vmin', (Math.min(rect.width, rect.height) / 100) + 'px');
+        }}
+    }});
+    tiles.forEach(tile => resizeObserver.observe(tile));
+
+    function updateTile(index, state) {{
+        const tile = tiles[index];
+        if (!tile) {{ console.error("js invalid tile index:", index); return; }}
+        if (state.immediate) tile.classList.add('no-transition');
+        if ('text' in state) tile.querySelector('h1').innerText = state.text;
+        if (state.colors) {{
+            for (const [key, value] of Object.entries(state.colors)) {{
+                if (key.startsWith('--')) tile.style.setProperty(key, value);
+            }}
+        }}
+        if ('active' in state) {{
+            tile.classList.toggle('animation-active', state.active);
+            tile.classList.toggle('stopped', !state.active);
+        }}
+        if (state.immediate) {{
+            void tile.offsetWidth; // apply the state before transitions come back
+            tile.classList.remove('no-transition');
+        }}
+    }}
+
+    function updateTiles(states) {{
+        for (const [index, state] of Object.entries(states)) updateTile(Number(index), state);
+    }}
+</script>
+</body>
+</html>
+"""
+
+TILE_MARKUP = """<main>
+    <span></span><span></span><span></span><span></span><span></span><span></span>
+    <span></span><span></span><span></span><span></span><span></span><span></span>
+    <span></span><span></span><span></span><span></span><span></span><span></span>
+    <div class="message-box"> <h1></h1> </div>
+    <div class="fade">⛔️</div>
+</main>"""
+
+
+class _NativeWallView(QWidget):
+    """qpainter rendering of all wall tiles, used when qtwebengine is unavailable."""
+
+    def __init__(self, wall):
+        super().__init__(wall)
+        register_native_font()
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self._wall = wall
+        self._move_clocks = [QElapsedTimer() for _ in wall._tiles]
+        self._fade_clocks = [QElapsedTimer() for _ in wall._tiles]
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self.update)
+
+    def tileChanged(self, index, active_changed=False, immediate=False):
+        """called by the wall after a tile's state changed."""
+        if active_changed:
+            if self._wall._tiles[index]["active"]:
+                self._move_clocks[index].start()
+            if immediate:
+                self._fade_clocks[index].invalidate()
+            else:
+                self._fade_clocks[index].start()
+        self._update_frame_timer()
+        self.update(self._tile_rect(index).toAlignedRect())
+
+    def _fade_progress(self, index, duration_ms):
+        clock = self._fade_clocks[index]
+        if not clock.isValid():
+            return 1.0
+        return min(clock.elapsed() / duration_ms, 1.0)
+
+    def _update_frame_timer(self):
+        animating = any(tile["active"] for tile in self._wall._tiles) or \
+            any(self._fade_progress(i, FADE_MS) < 1.0 for i in range(len(self._wall._tiles)))
+        if self.isVisible() and animating:
+            if not self._frame_timer.isActive():
+                self._frame_timer.start()
+        else:
+            self._frame_timer.stop()
+
+    def _tile_rect(self, index):
+        wall = self._wall
+        spacing = wall._spacing
+        row, column = divmod(index, wall.columns())
+        width = (self.width() - spacing * (wall.columns() - 1)) / wall.columns()
+        height = (self.height() - spacing * (wall.rows() - 1)) / wall.rows()
+        return QRectF(column * (width + spacing), row * (height + spacing), width, height)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 0, 0))
+        for index, tile in enumerate(self._wall._tiles):
+            rect = self._tile_rect(index)
+            if not rect.intersects(QRectF(event.rect())):
+                continue
+            painter.save()
+            painter.setClipRect(rect)
+            paint_cached_color_bars(painter, rect, tile["colors"], self.devicePixelRatioF())
+            box_progress = self._fade_progress(index, BOX_FADE_MS)
+            opacity = box_progress if tile["active"] else 1.0 - box_progress
+            elapsed = self._move_clocks[index].elapsed() if tile["active"] and self._move_clocks[index].isValid() else 0
+            paint_message_box(painter, rect, tile["colors"], tile["text"], elapsed, opacity)
+
+            fade_progress = self._fade_progress(index, FADE_MS)
+            black = fade_progress if not tile["active"] else 1.0 - fade_progress
+            if black > 0.0:
+                painter.setOpacity(black)
+                painter.fillRect(rect, QColor(0, 0, 0))
+                # glyph cached per tile size and device pixel ratio
+                paint_stop_indicator(painter, rect, max(1, round(min(rect.width(), rect.height()) * 0.12)))
+            painter.restore()
+        painter.end()
+        self._update_frame_timer()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_frame_timer()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._frame_timer.stop()
+
+
+class NoSignalWall(QWidget):
+    """
+    renders a grid of independent 'no signal' tiles in a single view.
+
+    one page (or one native painter) drives every tile, instead of one
+    qwebengineview and renderer per nosignalwidget. each tile has its own
+    text, colors and active state and is addressed either by its index
+    (row-major, starting at 0) or by a (row, column) tuple. the fade to black
+    and the stop indicator are done inside the page.
+    """
+
+    # signal emitted when the web content has finished loading successfully
+    loadFinished = pyqtSignal()
+    # signal emitted if the web content fails to load
+    loadFailed = pyqtSignal()
+
+    def __init__(self, rows=2, columns=2, initial_text="NO SIGNAL", initial_colors=None, start_active=True,
+                 spacing=2, parent=None, backend=BACKEND_AUTO):
+        """
+        initializes the wall.
+
+        args:
+            rows (int): number of tile rows.
+            columns (int): number of tile columns.
+            initial_text (str): text shown on every tile initially.
+            initial_colors (dict, optional): colors applied to every tile initially.
+            start_active (bool): if true, every tile starts animating after loading.
+            spacing (int): gap between tiles in pixels.
+            parent (qwidget, optional): parent widget. defaults to none.
+            backend (str): 'auto', 'web' or 'native', as for nosignalwidget.
+        """
+        super().__init__(parent)
+        if rows < 1 or columns < 1:
+            raise ValueError("a wall needs at least one row and one column.")
+        if backend == BACKEND_AUTO:
+            backend = BACKEND_WEB if webengine_classes() is not None else BACKEND_NATIVE
+        if backend not in (BACKEND_WEB, BACKEND_NATIVE):
+            raise ValueError(f"unknown backend '{backend}'. expected 'auto', 'web' or 'native'.")
+        if backend == BACKEND_WEB and webengine_classes() is None:
+            raise ImportError("the 'web' backend requires PyQt6-WebEngine, which could not be imported.")
+        self.backend = backend
+
+        self._rows = rows
+        self._columns = columns
+        self._spacing = spacing
+        self._is_page_loaded = False
+
+        colors = NoSignalWidget.DEFAULT_COLORS.copy()
+        colors.update(NoSignalWidget.resolveColors(initial_colors or {}))
+        self._tiles = [{"text": initial_text, "colors": dict(colors), "active": start_active}
+                       for _ in range(rows * columns)]
+
+        self.web_view = None
+        self.web_page = None
+        self.native_view = None
+        if self.backend == BACKEND_WEB:
+            QWebEngineView, QWebEnginePage = webengine_classes()
+            self.web_view = QWebEngineView(self)
+            self.web_page = QWebEnginePage(shared_profile(), self)
+            self.web_view.setPage(self.web_page)
+            self.web_page.setBackgroundColor(Qt.GlobalColor.transparent)
+            self._view = self.web_view
+        else:
+            self.native_view = _NativeWallView(self)
+            self._view = self.native_view
+        self._view.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self._view)
+
+        if self.backend == BACKEND_WEB:
+            self.web_page.loadFinished.connect(self._on_load_finished)
+            self._load_html()
+        else:
+            QTimer.singleShot(0, lambda: self._on_load_finished(True))
+
+    def rows(self):
+        return self._rows
+
+    def columns(self):
+        return self._columns
+
+    def tileCount(self):
+        return len(self._tiles)
+
+    def isLoaded(self):
+        """returns true once the content has finished loading."""
+        return self._is_page_loaded
+
+    def tileState(self, tile):
+        """returns a copy of the tile's current text, colors and active state."""
+        state = self._tiles[self._tile_index(tile)]
+        return {"text": state["text"], "colors": dict(state["colors"]), "active": state["active"]}
+
+    def _tile_index(self, tile):
+        """converts a tile index or (row, column) tuple into an index."""
+        if isinstance(tile, tuple):
+            row, column = tile
+            if not (0 <= row < self._rows and 0 <= column < self._columns):
+                raise IndexError(f"tile {tile} is outside the {self._rows}x{self._columns} wall.")
+            return row * self._columns + column
+        if not 0 <= tile < len(self._tiles):
+            raise IndexError(f"tile index {tile} is outside the wall (0..{len(self._tiles) - 1}).")
+        return tile
+
+    def _load_html(self):
+        """generates and loads the html content for the whole grid."""
+        root_colors = "\n".join(f"            {key}: {value};" for key, value in NoSignalWidget.DEFAULT_COLORS.items())
+        html_content = WALL_TEMPLATE.format(
+            root_colors=root_colors, font_face=font_face_css(), rows=self._rows, columns=self._columns, spacing=self._spacing,
+            fade_ms=FADE_MS, tiles="\n".join(TILE_MARKUP for _ in self._tiles))
+        self.web_view.setHtml(html_content, QUrl("https://local.nosignal.widget/"))
+        self._is_page_loaded = False
+
+    def _on_load_finished(self, ok):
+        """pushes the state of every tile to the page in one call."""
+        print(f"nosignalwall: page load finished: {'ok' if ok else 'failed'}")
+        self._is_page_loaded = ok
+        if not ok:
+            self.loadFailed.emit()
+            return
+        if self.web_page is not None:
+            states = {index: dict(tile, immediate=True) for index, tile in enumerate(self._tiles)}
+            self.web_page.runJavaScript(f"updateTiles({json.dumps(states)});")
+        else:
+            for index in range(len(self._tiles)):
+                self.native_view.tileChanged(index, active_changed=True, immediate=True)
+        self.loadFinished.emit()
+
+    def _push(self, index, state, immediate=False):
+        """sends a partial tile state to the backend."""
+        if not self._is_page_loaded:
+            return # the full state is sent on load
+        if self.web_page is not None:
+            if immediate:
+                state = dict(state, immediate=True)
+            self.web_page.runJavaScript(f"updateTile({index}, {json.dumps(state)});")
+        else:
+            self.native_view.tileChanged(index, active_changed="active" in state, immediate=immediate)
+
+    def setText(self, tile, text):
+        """sets the text of one tile."""
+        index = self._tile_index(tile)
+        self._tiles[index]["text"] = text
+        self._push(index, {"text": text})
+
+    def setColors(self, tile, colors_dict):
+        """sets colors of one tile; accepts css values or predefined names like nosignalwidget.setcolors."""
+        index = self._tile_index(tile)
+        resolved = NoSignalWidget.resolveColors(colors_dict)
+        changed = {key: value for key, value in resolved.items() if self._tiles[index]["colors"].get(key) != value}
+        if changed:
+            self._tiles[index]["colors"].update(changed)
+            self._push(index, {"colors": changed})
+
+    def start(self, tile, _immediate=False):
+        """starts one tile's animation and fades it in."""
+        index = self._tile_index(tile)
+        if not self._tiles[index]["active"] or _immediate:
+            self._tiles[index]["active"] = True
+            self._push(index, {"active": True}, immediate=_immediate)
+
+    def stop(self, tile, _immediate=False):
+        """stops one tile's animation and fades it to black."""
+        index = self._tile_index(tile)
+        if self._tiles[index]["active"] or _immediate:
+            self._tiles[index]["active"] = False
+            self._push(index, {"active": False}, immediate=_immediate)
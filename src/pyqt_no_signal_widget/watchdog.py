@@ -0,0 +1,233 @@
+# watchdog.py
+
+import math
+import time
+from collections import deque
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+# timer wheel entry kinds
+_CHECK_STALE = 0 # a healthy feed's heartbeat deadline
+_CHECK_RECOVERED = 1 # a stale feed has had heartbeats for recover_after
+_REFRESH_TEXT = 2 # a stale feed's "last seen" text is due
+
+
+def format_ago(seconds):
+    """'12s', '04:05' or '1:02:03' for a time span in seconds."""
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes:02d}:{seconds:02d}"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+class _Feed:
+    __slots__ = ("widget", "last_seen", "stale", "healthy_since", "last_stale_beat", "generation")
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.last_seen = None # timestamp of the newest heartbeat (none: never seen)
+        self.stale = False
+        self.healthy_since = None # stale feeds: start of the current run of heartbeats
+        self.last_stale_beat = None # stale feeds: previous heartbeat, to find gaps
+        self.generation = 0 # bumped on every state change; older wheel entries are ignored
+
+
+class SignalWatchdog(QObject):
+    """
+    drives nosignalwidgets from feed heartbeats.
+
+    each bound feed id starts stale: its widget is started (the no-signal
+    animation runs) with never_seen_text. once heartbeats have arrived
+    without a gap of stale_after_ms for recover_after_ms, the feed recovers
+    and its widget is stopped. a feed without a heartbeat for stale_after_ms
+    goes stale again: its widget is started and shows how long ago the feed
+    was last seen, refreshed every text_interval_ms. the two delays are the
+    hysteresis: a flapping feed doesn't toggle its widget on every beat.
+
+    every check runs on one coarse timer (tick_ms) over a hashed timer wheel
+    sized to the longest delay, so a tick only touches the entries due in
+    it. heartbeats of healthy feeds just store the timestamp, and the
+    deadline is re-armed lazily when it comes up. thousands of feeds
+    therefore cost no timer each and no work per heartbeat. heartbeat()
+    may be called from any thread. everything else belongs to the gui
+    thread.
+    """
+
+    feedStale = pyqtSignal(object) # feed id
+    feedRecovered = pyqtSignal(object) # feed id
+
+    def __init__(self, stale_after_ms=5000, recover_after_ms=2000, tick_ms=250, text_interval_ms=1000,
+                 text_format="LAST SEEN {ago} AGO", never_seen_text="NO SIGNAL", parent=None):
+        """
+        args:
+            stale_after_ms (int): heartbeat gap after which a feed is stale.
+            recover_after_ms (int): how long a stale feed must keep beating
+                (no gap of stale_after_ms) before it counts as recovered.
+            tick_ms (int): resolution of all checks.
+            text_interval_ms (int): refresh interval of a stale feed's text.
+            text_format (str): stale text; {ago} is the time since the last
+                heartbeat (see format_ago), {feed_id} the feed id.
+            never_seen_text (str): stale text of a feed without any heartbeat yet.
+            parent (qobject, optional): parent object.
+        """
+        super().__init__(parent)
+        self.stale_after = stale_after_ms / 1000.0
+        self.recover_after = recover_after_ms / 1000.0
+        self.text_interval = text_interval_ms / 1000.0
+        self.text_format = text_format
+        self.never_seen_text = never_seen_text
+        self._tick = tick_ms / 1000.0
+        # every entry is due at most max(delays) ahead, so with this many slots
+        # a slot only ever holds entries of the tick being processed
+        longest = max(self.stale_after, self.recover_after, self.text_interval)
+        self._slots = [[] for _ in range(math.ceil(longest / self._tick) + 2)]
+        self._origin = time.monotonic()
+        self._tick_index = 0 # next wheel tick to process
+        self._feeds = {} # feed id -> _feed
+        self._beats = deque() # (feed id, feed, timestamp) heartbeats of stale feeds, from any thread
+        self._ticks = 0
+        self._expired = 0
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(tick_ms)
+        self._timer.timeout.connect(self._on_tick)
+
+    # --- feeds ---
+    def bind(self, feed_id, widget):
+        """binds feed_id to widget (replacing an earlier binding); the feed starts stale."""
+        if not self._timer.isActive():
+            self._tick_index = self._elapsed_ticks(time.monotonic())
+            self._timer.start()
+        feed = self._feeds[feed_id] = _Feed(widget)
+        self._set_stale(feed_id, feed, time.monotonic())
+
+    def unbind(self, feed_id):
+        """forgets feed_id; its widget keeps its current state."""
+        self._feeds.pop(feed_id, None) # its wheel entries are dropped when they come up
+
+    def heartbeat(self, feed_id, timestamp=None):
+        """
+        records a sign of life of feed_id. thread-safe.
+
+        args:
+            feed_id: a bound feed id (unknown ids are ignored).
+            timestamp (float, optional): time.monotonic() of the frame; now by default.
+        """
+        feed = self._feeds.get(feed_id)
+        if feed is None:
+            return
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if feed.last_seen is None or timestamp > feed.last_seen:
+            feed.last_seen = timestamp
+        if feed.stale:
+            self._beats.append((feed_id, feed, timestamp)) # recovery is decided on the gui thread
+
+    def isStale(self, feed_id):
+        feed = self._feeds.get(feed_id)
+        return feed is not None and feed.stale
+
+    def lastSeen(self, feed_id):
+        """time.monotonic() of the feed's newest heartbeat, or none."""
+        feed = self._feeds.get(feed_id)
+        return feed.last_seen if feed is not None else None
+
+    def stats(self):
+        """bound feeds, stale feeds, ticks so far and wheel entries that came due."""
+        return {"feeds": len(self._feeds), "stale": sum(1 for feed in self._feeds.values() if feed.stale),
+                "ticks": self._ticks, "expired": self._expired}
+
+    # --- state changes ---
+    def _text(self, feed_id, feed, now):
+        if feed.last_seen is None:
+            return self.never_seen_text
+        return self.text_format.format(ago=format_ago(now - feed.last_seen), feed_id=feed_id)
+
+    def _widget(self, feed):
+        return None if sip.isdeleted(feed.widget) else feed.widget
+
+    def _set_stale(self, feed_id, feed, now):
+        feed.stale = True
+        feed.generation += 1
+        feed.healthy_since = None
+        feed.last_stale_beat = feed.last_seen
+        widget = self._widget(feed)
+        if widget is not None:
+            widget.setText(self._text(feed_id, feed, now))
+            widget.start()
+        self._schedule(feed_id, feed, _REFRESH_TEXT, now + self.text_interval)
+        self.feedStale.emit(feed_id)
+
+    def _set_recovered(self, feed_id, feed):
+        feed.stale = False
+        feed.generation += 1
+        feed.healthy_since = None
+        widget = self._widget(feed)
+        if widget is not None:
+            widget.stop()
+        self._schedule(feed_id, feed, _CHECK_STALE, feed.last_seen + self.stale_after)
+        self.feedRecovered.emit(feed_id)
+
+    # --- timer wheel ---
+    def _tick_of(self, deadline):
+        """the first tick at or after deadline."""
+        return math.ceil((deadline - self._origin) / self._tick)
+
+    def _elapsed_ticks(self, now):
+        """the last tick at or before now."""
+        return math.floor((now - self._origin) / self._tick)
+
+    def _schedule(self, feed_id, feed, kind, deadline):
+        tick = max(self._tick_index, self._tick_of(deadline))
+        self._slots[tick % len(self._slots)].append((deadline, kind, feed_id, feed, feed.generation))
+
+    def _on_tick(self):
+        now = time.monotonic()
+        self._ticks += 1
+        for _ in range(len(self._beats)): # heartbeats of stale feeds, in arrival order
+            feed_id, feed, timestamp = self._beats.popleft()
+            if self._feeds.get(feed_id) is not feed or not feed.stale:
+                continue
+            if feed.healthy_since is None or timestamp - feed.last_stale_beat >= self.stale_after:
+                feed.healthy_since = timestamp # a new run of heartbeats (the first, or after a gap)
+                self._schedule(feed_id, feed, _CHECK_RECOVERED, timestamp + self.recover_after)
+            feed.last_stale_beat = timestamp
+
+        current = self._elapsed_ticks(now)
+        while self._tick_index <= current: # catches up if the gui thread was busy
+            index = self._tick_index % len(self._slots)
+            slot, self._slots[index] = self._slots[index], []
+            self._tick_index += 1
+            for entry in slot:
+                self._fire(entry, now)
+        if not self._feeds:
+            self._timer.stop()
+
+    def _fire(self, entry, now):
+        deadline, kind, feed_id, feed, generation = entry
+        if self._feeds.get(feed_id) is not feed or feed.generation != generation:
+            return # unbound, or the feed changed state since this was scheduled
+        if deadline > now:
+            self._schedule(feed_id, feed, kind, deadline) # came up a wheel turn early after a long stall
+            return
+        self._expired += 1
+        if kind == _CHECK_STALE:
+            due = feed.last_seen + self.stale_after
+            if due > now:
+                self._schedule(feed_id, feed, _CHECK_STALE, due) # beats arrived since; re-arm
+            else:
+                self._set_stale(feed_id, feed, now)
+        elif kind == _CHECK_RECOVERED:
+            # skipped if a gap started a newer run (checked on its own schedule) or the feed went quiet
+            if (feed.healthy_since is not None and now - feed.healthy_since >= self.recover_after
+                    and now - feed.last_seen < self.stale_after):
+                self._set_recovered(feed_id, feed)
+        elif kind == _REFRESH_TEXT:
+            widget = self._widget(feed)
+            if widget is not None:
+                widget.setText(self._text(feed_id, feed, now))
+            self._schedule(feed_id, feed, _REFRESH_TEXT, now + self.text_interval)
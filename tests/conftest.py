@@ -0,0 +1,49 @@
+# conftest.py
+#
+# every test runs offscreen on the native backend; nothing needs qtwebengine.
+
+import os
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def spin(qapp):
+    """runs the event loop for ms milliseconds."""
+    def run(ms):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+    return run
+
+
+@pytest.fixture
+def page_widget(qapp, spin):
+    """
+    a nosignalwidget whose commands take the web page path (_pending_state and
+    applystate scripts) without a page: the native view is detached and the
+    scripts that would run are recorded in widget.scripts.
+    """
+    from pyqt_no_signal_widget import NoSignalWidget
+
+    widget = NoSignalWidget(backend="native", start_active=False)
+    spin(0) # the native 'page' has loaded
+    widget.native_view = None
+    widget._bridge = None
+    widget._is_page_loaded = False
+    widget._is_frozen = False
+    widget.scripts = []
+    widget._run_javascript = lambda script, callback=None: widget.scripts.append(script)
+    widget._update_lifecycle = lambda: None # there is no page to freeze
+    widget._freeze_timer.timeout.disconnect()
+    yield widget
+    widget.deleteLater()
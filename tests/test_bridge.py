@@ -0,0 +1,81 @@
+# test_bridge.py
+#
+# drives pagebridge through a qwebchannel with an in-process transport, the
+# way the page's qwebchannel.js talks to it, and checks what goes over the wire.
+
+import pytest
+
+QtWebChannel = pytest.importorskip("PyQt6.QtWebChannel")
+
+from PyQt6.QtCore import QCoreApplication, QJsonDocument
+from pyqt_no_signal_widget.bridge import PageBridge, BRIDGE_NAME
+
+# qwebchannel message types (qwebchannel.js)
+SIGNAL, INIT, IDLE, INVOKE_METHOD, CONNECT_TO_SIGNAL = 1, 3, 4, 6, 7
+
+
+class RecordingTransport(QtWebChannel.QWebChannelAbstractTransport):
+    """the page's end of the channel: records what python sends."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def sendMessage(self, message):
+        self.sent.append(QJsonDocument(message).toVariant())
+
+    def receive(self, message):
+        self.messageReceived.emit(QJsonDocument.fromVariant(message).object(), self)
+
+
+@pytest.fixture
+def page(qapp):
+    """a bridge published on a channel, with a client that has done the init handshake."""
+    bridge = PageBridge()
+    channel = QtWebChannel.QWebChannel()
+    channel.registerObject(BRIDGE_NAME, bridge)
+    transport = RecordingTransport()
+    channel.connectTo(transport)
+    transport.receive({"type": INIT, "id": 0})
+    QCoreApplication.processEvents()
+    meta = transport.sent[-1]["data"][BRIDGE_NAME]
+    transport.methods = {name: index for name, index in meta["methods"]}
+    transport.signals = dict(meta["signals"])
+    transport.receive({"type": IDLE})
+    QCoreApplication.processEvents()
+    yield bridge, transport
+    channel.disconnectFrom(transport)
+
+
+def test_push_state_arrives_as_json_object(page):
+    bridge, transport = page
+    transport.receive({"type": CONNECT_TO_SIGNAL, "object": BRIDGE_NAME,
+                       "signal": transport.signals["stateChanged"]})
+    QCoreApplication.processEvents()
+    transport.sent.clear()
+
+    state = {"seq": 3, "text": "hi", "active": True, "immediate": False, "colors": {"--red": "#ff0000"},
+             "transition": {"colors": {"--blue": "#0000ff"}, "duration": 500, "easing": "ease-in-out"}}
+    bridge.pushState(state)
+    QCoreApplication.processEvents()
+
+    messages = [m for m in transport.sent if m.get("type") == SIGNAL]
+    assert len(messages) == 1
+    (payload,) = messages[0]["args"]
+    assert isinstance(payload, dict) # not the python repr string
+    assert payload == state
+
+
+def test_page_calls_reach_python(page):
+    bridge, transport = page
+    applied = []
+    bridge.stateApplied.connect(lambda seq, active: applied.append((seq, active)))
+
+    transport.receive({"type": INVOKE_METHOD, "object": BRIDGE_NAME, "id": 1,
+                       "method": transport.methods["ready"], "args": []})
+    transport.receive({"type": INVOKE_METHOD, "object": BRIDGE_NAME, "id": 2,
+                       "method": transport.methods["acknowledge"], "args": [3, True]})
+    QCoreApplication.processEvents()
+
+    assert bridge.isConnected()
+    assert applied == [(3, True)]
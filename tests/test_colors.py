@@ -0,0 +1,44 @@
+# test_colors.py
+
+import pytest
+from pyqt_no_signal_widget.colors import normalize_css_color
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("red", "rgba(255, 0, 0, 1)"),
+    ("#00ff00", "rgba(0, 255, 0, 1)"),
+    ("#0000ff80", "rgba(0, 0, 255, 0.502)"), # css #rrggbbaa, not qt's #aarrggbb
+    ("#f008", "rgba(255, 0, 0, 0.533)"),
+    ("rgb(10, 20, 30)", "rgba(10, 20, 30, 1)"),
+    ("rgba(10 20 30 / 50%)", "rgba(10, 20, 30, 0.5)"),
+    ("rgb(100%, 0%, 0%)", "rgba(255, 0, 0, 1)"),
+    ("hsl(120, 100%, 50%)", "rgba(0, 255, 0, 1)"),
+    ("hsla(240deg, 100%, 50%, 0.25)", "rgba(0, 0, 255, 0.25)"),
+])
+def test_normalize_css_color(value, expected):
+    assert normalize_css_color(value) == expected
+
+
+@pytest.mark.parametrize("value", ["nope", "rgb(1, 2)", "rgb(a, b, c)", "", None])
+def test_normalize_css_color_rejects_invalid(value):
+    assert normalize_css_color(value) is None
+
+
+def test_set_colors_only_sends_changed_values(page_widget):
+    page_widget.setColors({"--red": "red", "--blue": "blue"})
+    page_widget._pending_state.clear()
+    queued = page_widget._queued_command_count
+
+    # the same resolved values, spelled differently: nothing to send
+    page_widget.setColors({"--red": "#ff0000", "--blue": "rgb(0, 0, 255)"})
+    assert page_widget._pending_state == {}
+    assert page_widget._queued_command_count == queued
+
+    page_widget.setColors({"--red": "#ff0000", "--blue": "bright_red"})
+    assert page_widget._pending_state == {"colors": {"--blue": page_widget.resolveColor("bright_red")}}
+
+
+def test_set_colors_skips_invalid_entries(page_widget, capsys):
+    page_widget.setColors({"red": "red", "--red": "nope", "--blue": 5, "--green": "#00ff00"})
+    assert page_widget._pending_state == {"colors": {"--green": "rgba(0, 255, 0, 1)"}}
+    assert capsys.readouterr().out.count("warning:") == 3
@@ -0,0 +1,42 @@
+# test_dispatch.py
+
+import threading
+from pyqt_no_signal_widget import NoSignalWidget, post_counters
+
+
+def test_posts_from_threads_are_coalesced_per_widget(qapp, spin):
+    widgets = [NoSignalWidget(backend="native", start_active=False) for _ in range(3)]
+    spin(50)
+    before = post_counters()
+
+    def producer(worker):
+        for step in range(200):
+            for widget in widgets:
+                widget.post(text=f"W{worker} {step}", colors={f"--c{worker}": "red"})
+
+    threads = [threading.Thread(target=producer, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for widget in widgets:
+        widget.post(text="DONE", active=True)
+    spin(200)
+
+    after = post_counters()
+    assert after["queued"] == 0
+    drains = after["drains"] - before["drains"]
+    assert 1 <= drains < 20 # batched, not one drain per post
+    for widget in widgets:
+        assert widget.text() == "DONE" # last text wins
+        assert widget._is_active
+        # colors from every worker were merged
+        assert all(widget._current_widget_colors[f"--c{worker}"] == "rgba(255, 0, 0, 1)" for worker in range(4))
+
+
+def test_post_skips_deleted_widgets(qapp, spin):
+    widget = NoSignalWidget(backend="native", start_active=False)
+    widget.post(text="GONE")
+    widget.deleteLater()
+    spin(100) # the widget is deleted before or during the drain; neither may raise
+    assert post_counters()["queued"] == 0
@@ -0,0 +1,52 @@
+# test_loop.py
+
+import pytest
+from pyqt_no_signal_widget.loop import (LoopFile, export_loop, ENCODING_RAW, ENCODING_RLE, _rle_encode,
+                                        _rle_decode)
+from pyqt_no_signal_widget.snapshot import resolve_palette
+
+
+def frame_bytes(image):
+    return image.constBits().asstring(image.sizeInBytes())
+
+
+def test_rle_round_trip():
+    data = bytes([1, 2, 3, 4]) * 50 + bytes([9, 9, 9, 9]) + bytes([1, 2, 3, 4]) * 3
+    encoded = _rle_encode(data)
+    assert len(encoded) < len(data)
+    assert _rle_decode(encoded) == data
+
+
+@pytest.fixture(scope="module")
+def loops(qapp, tmp_path_factory):
+    directory = tmp_path_factory.mktemp("loops")
+    paths = {}
+    for encoding in (ENCODING_RAW, ENCODING_RLE):
+        paths[encoding] = str(directory / f"{encoding}.nsloop")
+        export_loop(paths[encoding], text="Feed 1", size=(64, 36), fps=2, encoding=encoding)
+    return {encoding: LoopFile(path) for encoding, path in paths.items()}
+
+
+def test_rle_frames_match_raw_frames(loops):
+    raw, rle = loops[ENCODING_RAW], loops[ENCODING_RLE]
+    assert rle.frame_count == raw.frame_count > 1
+    assert (rle.pixel_width, rle.pixel_height) == (raw.pixel_width, raw.pixel_height) == (64, 36)
+    for index in range(raw.frame_count):
+        assert frame_bytes(rle.frame(index)) == frame_bytes(raw.frame(index))
+
+
+def test_loop_metadata_and_matching(loops):
+    loop = loops[ENCODING_RLE]
+    palette = resolve_palette(None)
+    assert loop.logical_size() == (64, 36)
+    assert loop.matches("FEED 1", palette) # drawn uppercased either way
+    assert not loop.matches("FEED 2", palette)
+    assert not loop.matches("Feed 1", palette, shadow=False)
+    assert not loop.matches("Feed 1", resolve_palette({"--red": "blue"}))
+
+
+def test_not_a_loop_file(tmp_path):
+    path = tmp_path / "bad.nsloop"
+    path.write_bytes(b"not a loop file" * 10)
+    with pytest.raises(ValueError):
+        LoopFile(str(path))
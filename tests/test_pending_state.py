@@ -0,0 +1,47 @@
+# test_pending_state.py
+
+import json
+
+
+def applied_states(widget):
+    """the state batches of the recorded applystate() scripts."""
+    prefix, suffix = "applyState(", ");"
+    assert all(script.startswith(prefix) and script.endswith(suffix) for script in widget.scripts)
+    return [json.loads(script[len(prefix):-len(suffix)]) for script in widget.scripts]
+
+
+def test_commands_before_load_are_coalesced(page_widget):
+    page_widget.setText("ONE")
+    page_widget.setText("TWO")
+    page_widget.setColors({"--red": "#00ff00"})
+    page_widget.setColors({"--blue": "orange"})
+    page_widget.start(_immediate=True)
+    page_widget.stop(_immediate=True)
+
+    assert page_widget.scripts == [] # nothing runs before the page has loaded
+    assert page_widget._pending_state == {
+        "text": "TWO", # last text wins
+        "colors": {"--red": "rgba(0, 255, 0, 1)", "--blue": "rgba(255, 165, 0, 1)"}, # merged
+        "active": False, "immediate": True, # last start/stop wins
+    }
+
+
+def test_pre_load_commands_replay_as_one_apply_state(page_widget):
+    page_widget.setText("CAMERA 3")
+    page_widget.setColors({"--text-color": "red"})
+    page_widget.start(_immediate=True)
+
+    page_widget._on_load_finished(True)
+
+    assert applied_states(page_widget) == [{"text": "CAMERA 3", "colors": {"--text-color": "rgba(255, 0, 0, 1)"},
+                                            "active": True, "immediate": True}]
+    assert page_widget._pending_state == {}
+
+
+def test_direct_colors_drop_queued_transition_keys(page_widget):
+    page_widget.transitionColors({"--red": "blue", "--blue": "red"}, 300, "linear")
+    page_widget.setColors({"--red": "green"})
+
+    transition = page_widget._pending_state["transition"]
+    assert transition["colors"] == {"--blue": "rgba(255, 0, 0, 1)"}
+    assert page_widget._pending_state["colors"] == {"--red": "rgba(0, 128, 0, 1)"}
@@ -0,0 +1,95 @@
+# test_watchdog.py
+
+import time
+import pytest
+from pyqt_no_signal_widget import NoSignalWidget, SignalWatchdog
+from pyqt_no_signal_widget.watchdog import format_ago
+
+STALE_MS, RECOVER_MS, TICK_MS = 150, 250, 10
+
+
+@pytest.fixture
+def watchdog(qapp):
+    watchdog = SignalWatchdog(stale_after_ms=STALE_MS, recover_after_ms=RECOVER_MS, tick_ms=TICK_MS,
+                              text_interval_ms=100)
+    watchdog.events = []
+    watchdog.feedStale.connect(lambda feed_id: watchdog.events.append(("stale", feed_id)))
+    watchdog.feedRecovered.connect(lambda feed_id: watchdog.events.append(("recovered", feed_id)))
+    yield watchdog
+    watchdog.deleteLater()
+
+
+@pytest.fixture
+def widget(qapp, spin):
+    widget = NoSignalWidget(backend="native", start_active=False)
+    spin(0)
+    yield widget
+    widget.deleteLater()
+
+
+def beat_for(watchdog, spin, feed_id, ms, period_ms=20):
+    """heartbeats feed_id every period_ms for ms while the event loop runs."""
+    end = time.monotonic() + ms / 1000.0
+    while time.monotonic() < end:
+        watchdog.heartbeat(feed_id)
+        spin(period_ms)
+
+
+@pytest.mark.parametrize("seconds, expected", [(0, "0s"), (59.9, "59s"), (65, "01:05"), (3723, "1:02:03")])
+def test_format_ago(seconds, expected):
+    assert format_ago(seconds) == expected
+
+
+def test_feed_starts_stale(watchdog, widget):
+    watchdog.bind("cam", widget)
+    assert watchdog.isStale("cam")
+    assert widget._is_active
+    assert widget.text() == "NO SIGNAL"
+
+
+def test_recovers_after_steady_heartbeats_and_goes_stale_when_silent(watchdog, widget, spin):
+    watchdog.bind("cam", widget)
+    beat_for(watchdog, spin, "cam", RECOVER_MS + 150)
+    assert not watchdog.isStale("cam")
+    assert not widget._is_active
+
+    spin(STALE_MS + 100)
+    assert watchdog.isStale("cam")
+    assert widget._is_active
+    assert widget.text().startswith("LAST SEEN")
+    assert watchdog.events == [("stale", "cam"), ("recovered", "cam"), ("stale", "cam")]
+
+
+def test_flapping_feed_does_not_recover(watchdog, widget, spin):
+    watchdog.bind("cam", widget)
+    # bursts separated by gaps longer than stale_after: each burst starts a new
+    # run, and none lasts recover_after before its gap shows
+    for _ in range(4):
+        beat_for(watchdog, spin, "cam", RECOVER_MS - STALE_MS - 30)
+        spin(STALE_MS + 50)
+    assert watchdog.isStale("cam")
+    assert watchdog.events == [("stale", "cam")]
+
+
+def test_tick_work_scales_with_due_entries(qapp, widget, spin):
+    watchdog = SignalWatchdog(stale_after_ms=STALE_MS, tick_ms=TICK_MS, text_interval_ms=500)
+    for feed_id in range(2000):
+        watchdog.bind(feed_id, widget)
+    spin(200)
+    stats = watchdog.stats()
+    assert stats["stale"] == 2000
+    assert stats["ticks"] >= 5
+    assert stats["expired"] == 0 # ticks went by, but no entry came due
+
+    spin(400)
+    assert watchdog.stats()["expired"] == 2000 # one text refresh per feed
+    watchdog.deleteLater()
+
+
+def test_unbound_feeds_are_ignored(watchdog, widget, spin):
+    watchdog.bind("cam", widget)
+    watchdog.unbind("cam")
+    watchdog.heartbeat("cam")
+    spin(50)
+    assert watchdog.stats()["feeds"] == 0
+    assert watchdog.lastSeen("cam") is None